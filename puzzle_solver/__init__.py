@@ -0,0 +1,24 @@
+"""Sliding-tile puzzle solvers.
+
+Importing the package loads only the solver core; the Tk GUI (puzzle_solver.gui) and NumPy (the 'vectorized'
+mode) are imported the first time they are actually used, so scripts and worker processes start quickly.
+"""
+from .board import (SUPPORTED_SIZES, default_goal, get_goal_positions, calculate_manhattan_distance, is_solvable,
+                    is_valid_board, generate_random_puzzle, encode_state, decode_state, board_geometry, tile_moves)
+from .heuristics import HEURISTICS, get_heuristic
+from .search import (CancelToken, SearchAborted, SearchBudget, SearchTelemetry, SOLVERS, SUBOPTIMAL_SOLVERS,
+                     solve_puzzle)
+from .tables import load_distance_table
+from .generate import random_solvable_state, iter_puzzles
+from .cache import SolutionCache, path_to_moves, moves_to_path
+from .history import HistoryManager
+
+__all__ = [
+    'SUPPORTED_SIZES', 'default_goal', 'get_goal_positions', 'calculate_manhattan_distance', 'is_solvable',
+    'is_valid_board', 'generate_random_puzzle', 'encode_state', 'decode_state', 'board_geometry', 'tile_moves',
+    'HEURISTICS', 'get_heuristic',
+    'CancelToken', 'SearchAborted', 'SearchBudget', 'SearchTelemetry', 'SOLVERS', 'SUBOPTIMAL_SOLVERS',
+    'solve_puzzle',
+    'load_distance_table', 'random_solvable_state', 'iter_puzzles',
+    'SolutionCache', 'path_to_moves', 'moves_to_path', 'HistoryManager',
+]
@@ -0,0 +1,4 @@
+"""python -m puzzle_solver: the same entry point as 8_tile_puzzle.py."""
+from .cli import main
+
+main()
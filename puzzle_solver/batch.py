@@ -0,0 +1,126 @@
+"""Headless batch solving of JSON-lines puzzles on a process pool."""
+import time
+import json
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+from .board import default_goal, is_solvable, is_valid_board
+from .search import SearchAborted, solve_puzzle
+from .cache import SolutionCache
+
+
+# --- Headless Batch Solving ---
+# Puzzles stream in as JSON lines, either a bare board ([[...], [...], [...]]) or an object
+# {"initial": board, "goal": board (optional), "id": any (optional)}. Lines are solved in chunks on a process
+# pool, and at most `window` chunks are in flight, so inputs of any length are never held in memory at once.
+
+
+_worker_caches = {}
+
+
+def _worker_cache(cache_file):
+    """The SolutionCache for cache_file in this worker process, opened on first use."""
+    if not cache_file:
+        return None
+    if cache_file not in _worker_caches:
+        _worker_caches[cache_file] = SolutionCache(cache_file)
+    return _worker_caches[cache_file]
+
+
+def _board_error(initial_state, goal):
+    """Why this pair cannot be solved, or None if it can."""
+    if not is_valid_board(initial_state) or not is_valid_board(goal):
+        return 'invalid board (expected NxN rows holding 0..N*N-1 once each, N = 3, 4 or 5)'
+    if len(initial_state) != len(goal):
+        return 'initial and goal boards differ in size'
+    if not is_solvable(initial_state, goal):
+        return 'unsolvable for this goal state'
+    return None
+
+
+def _solve_batch_line(line_no, line, goal_state, with_path, options, cache=None):
+    result = {'line': line_no}
+    try:
+        record = json.loads(line)
+        if not isinstance(record, dict):
+            record = {'initial': record}
+        if 'id' in record:
+            result['id'] = record['id']
+        initial_state, goal = record.get('initial'), record.get('goal', goal_state)
+    except (json.JSONDecodeError, AttributeError):
+        result['error'] = 'invalid JSON'
+        return result
+    if goal is None and is_valid_board(initial_state):
+        goal = default_goal(len(initial_state))
+    error = _board_error(initial_state, goal)
+    if error:
+        result['error'] = error
+    else:
+        start_time = time.perf_counter()
+        try:
+            if cache is None:
+                path, nodes = solve_puzzle(initial_state, goal, **options)
+            else:
+                hits = cache.hits
+                path, nodes = cache.solve(initial_state, goal, **options)
+                result['cached'] = cache.hits > hits
+        except SearchAborted as aborted:
+            result.update(error=str(aborted), nodes=aborted.nodes_explored)
+            return result
+        except ValueError as e:  # e.g. a mode or heuristic that does not support this board size
+            result['error'] = str(e)
+            return result
+        result.update(moves=len(path) - 1 if path else None, nodes=nodes,
+                      time=round(time.perf_counter() - start_time, 6))
+        if with_path:
+            result['path'] = path
+    return result
+
+
+def _solve_batch_chunk(chunk, goal_state, with_path, options, cache_file=None):
+    cache = _worker_cache(cache_file)
+    return [_solve_batch_line(line_no, line, goal_state, with_path, options, cache) for line_no, line in chunk]
+
+
+def solve_batch(lines, goal_state=None, workers=None, ordered=True, chunk_size=64, window=None,
+                with_path=False, cache_file=None, **options):
+    """Solves an iterable of JSON lines on a process pool and yields one result dict per non-blank line.
+
+    Lines without their own goal use goal_state, or the default goal for their board size if that is None.
+    With cache_file, every worker checks and fills that SolutionCache and results carry a 'cached' flag.
+
+    Results come back in input order when ordered is True, otherwise as soon as their chunk finishes. Bad or
+    unsolvable lines yield a result with an 'error' key instead of stopping the run. Extra keyword options go
+    to solve_puzzle (algorithm, heuristic, ...).
+    """
+    workers = workers or os.cpu_count() or 1
+    window = window or workers * 2
+    with ProcessPoolExecutor(workers) as pool:
+        pending = deque()
+
+        def submit(chunk):
+            pending.append(pool.submit(_solve_batch_chunk, chunk, goal_state, with_path, options, cache_file))
+
+        def collect():
+            if ordered:
+                yield from pending.popleft().result()
+                return
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                pending.remove(future)
+                yield from future.result()
+
+        chunk = []
+        for line_no, line in enumerate(lines, 1):
+            if line.strip():
+                chunk.append((line_no, line))
+            if len(chunk) >= chunk_size:
+                submit(chunk)
+                chunk = []
+                while len(pending) >= window:
+                    yield from collect()
+        if chunk:
+            submit(chunk)
+        while pending:
+            yield from collect()
@@ -0,0 +1,227 @@
+"""Reproducible solver benchmarks on depth-stratified corpora, with saved baselines."""
+import time
+import random
+import json
+import os
+import tracemalloc
+import cProfile
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import resource  # peak RSS per configuration; Unix only
+except ImportError:
+    resource = None
+
+from .board import board_geometry, encode_state, decode_state, default_goal
+from .heuristics import HEURISTICS
+from .search import OPEN_LISTS, SOLVERS, SearchAborted, SUBOPTIMAL_SOLVERS, _open_list, solve_puzzle
+
+
+# --- Benchmarks ---
+# A corpus holds seeded 3x3 puzzles stratified by optimal depth (0-31), for the default goal and a custom one.
+# Each solver configuration runs over it in a fresh worker process, so its peak RSS is its own, and the results
+# are saved as a JSON baseline that later runs can be compared against.
+
+BENCH_GOALS = {'default': default_goal(3), 'spiral': [[1, 2, 3], [8, 0, 4], [7, 6, 5]]}
+BENCH_CONFIGS = ('astar:manhattan', 'astar:manhattan:heap', 'astar:linear_conflict', 'astar:walking_distance',
+                 'astar:pattern_database', 'idastar:linear_conflict', 'idastar:walking_distance', 'bidirectional',
+                 'table')
+BENCH_CORPUS_KEYS = ('seed', 'per_depth', 'max_depth')  # runs are only comparable on the same corpus
+BENCH_METRICS = {'p50': 1, 'p95': 1, 'p99': 1, 'nodes': 1, 'final_layer': 1, 'nodes_per_sec': -1,
+                 'peak_alloc_kb': 1}  # 1: lower is better
+BENCH_REPEAT = 3  # timed solves per puzzle; its latency is the fastest of them
+BENCH_TIMING_METRICS = ('p50', 'p95', 'p99', 'nodes_per_sec')  # clock-dependent; the rest are deterministic
+BENCH_NOISE_FLOOR = 0.001  # seconds per solve a timing must grow by, on top of the threshold, to be flagged
+
+
+def states_by_depth(goal_state):
+    """Breadth-first search from the goal; returns one list of packed states per optimal solution depth."""
+    bits, mask, neighbors = board_geometry(len(goal_state))
+    goal = encode_state(goal_state)
+    seen, frontier, layers = {goal}, [(goal, [t for row in goal_state for t in row].index(0))], []
+    while frontier:
+        layers.append([code for code, _ in frontier])
+        next_frontier = []
+        for code, blank in frontier:
+            for cell in neighbors[blank]:
+                tile = (code >> cell * bits) & mask
+                new_code = code - (tile << cell * bits) + (tile << blank * bits)
+                if new_code not in seen:
+                    seen.add(new_code)
+                    next_frontier.append((new_code, cell))
+        frontier = next_frontier
+    return layers
+
+
+def build_corpus(per_depth=3, seed=0, goals=None, max_depth=31):
+    """Returns [{'goal', 'initial', 'depth'}] with up to per_depth seeded puzzles for every depth 0..max_depth."""
+    rng = random.Random(seed)
+    corpus = []
+    for name, goal_state in (goals or BENCH_GOALS).items():
+        if len(goal_state) != 3:
+            raise ValueError("Benchmark corpora enumerate every state, so they are 3x3 only")
+        for depth, layer in enumerate(states_by_depth(goal_state)[:max_depth + 1]):
+            for code in rng.sample(sorted(layer), min(per_depth, len(layer))):
+                corpus.append({'goal': name, 'goal_state': goal_state, 'initial': decode_state(code), 'depth': depth})
+    return corpus
+
+
+def _percentile(sorted_values, q):
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))] if sorted_values else None
+
+
+def bench_options(config):
+    """'algorithm[:heuristic[:open list]]' -> solve_puzzle options; raises ValueError for a malformed config.
+
+    The heuristic defaults to manhattan, as in solve_puzzle; only A* takes an open list.
+    """
+    algorithm, heuristic, open_list = (config.split(':') + ['', ''])[:3]
+    if algorithm not in SOLVERS:
+        raise ValueError(f"{config}: unknown algorithm {algorithm!r}; expected one of {', '.join(SOLVERS)}")
+    if heuristic and heuristic not in HEURISTICS:
+        raise ValueError(f"{config}: unknown heuristic {heuristic!r}; expected one of {', '.join(HEURISTICS)}")
+    options = {'algorithm': algorithm, 'heuristic': heuristic or 'manhattan'}
+    if open_list:
+        if algorithm != 'astar':
+            raise ValueError(f"{config}: only astar takes an open list")
+        if open_list not in OPEN_LISTS:
+            raise ValueError(f"{config}: unknown open list {open_list!r}; expected one of {', '.join(OPEN_LISTS)}")
+        options['open_list'] = open_list
+    return options
+
+
+def _bench_configuration(corpus, config, trace_memory=True, time_limit=None, profile_dir=None,
+                         repeat=BENCH_REPEAT):
+    """Runs one 'algorithm[:heuristic[:open list]]' configuration over the corpus (in its own worker process).
+
+    Each puzzle is solved repeat times and its latency is the fastest run, which filters out scheduler noise
+    on sub-millisecond solves. With profile_dir, the first run of each puzzle is under cProfile and the stats
+    are saved as <config>.prof there. For A*, final_layer totals the nodes expanded at each solution's f-value.
+    """
+    options = dict(bench_options(config), time_limit=time_limit)
+    algorithm = options['algorithm']
+    setup_start = time.perf_counter()
+    for goal_state in {json.dumps(p['goal_state']): p['goal_state'] for p in corpus}.values():
+        solve_puzzle(goal_state, goal_state, **options)  # builds heuristic tables outside the timings
+    setup = time.perf_counter() - setup_start
+    latencies, nodes, aborted, by_depth = [], 0, 0, {}
+    final_layer = 0 if algorithm == 'astar' else None
+    profiler = cProfile.Profile() if profile_dir else None
+    for puzzle in corpus:
+        if final_layer is not None:
+            options['stats'] = {}
+        start = time.perf_counter()
+        try:
+            path, explored = solve_puzzle(puzzle['initial'], puzzle['goal_state'], profile=profiler, **options)
+        except SearchAborted as e:
+            aborted, explored, path = aborted + 1, e.nodes_explored, None
+        elapsed = time.perf_counter() - start
+        for _ in range(repeat - 1 if path is not None else 0):  # an aborted puzzle would only hit its limit again
+            start = time.perf_counter()
+            try:
+                solve_puzzle(puzzle['initial'], puzzle['goal_state'], **options)
+            except SearchAborted:
+                break
+            elapsed = min(elapsed, time.perf_counter() - start)
+        if path is not None and len(path) - 1 != puzzle['depth'] and algorithm not in SUBOPTIMAL_SOLVERS:
+            raise AssertionError(f"{config} returned {len(path) - 1} moves for a depth-{puzzle['depth']} puzzle")
+        latencies.append(elapsed)
+        nodes += explored
+        if final_layer is not None and path is not None:
+            final_layer += options['stats']['final_layer']
+        by_depth.setdefault(puzzle['depth'], []).append(elapsed)
+    if profiler:
+        profiler.dump_stats(os.path.join(profile_dir, config.replace(':', '-') + '.prof'))
+    peak_alloc = 0
+    if trace_memory:  # a second pass, since tracemalloc slows the solvers down several times
+        tracemalloc.start()
+        for puzzle in corpus:
+            tracemalloc.reset_peak()
+            try:
+                solve_puzzle(puzzle['initial'], puzzle['goal_state'], **options)
+            except SearchAborted:
+                pass
+            peak_alloc = max(peak_alloc, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    total, latencies = sum(latencies), sorted(latencies)
+    return {'config': config, 'puzzles': len(corpus), 'aborted': aborted, 'setup': round(setup, 4),
+            'seconds': round(total, 4), 'nodes': nodes, 'final_layer': final_layer,
+            'nodes_per_sec': round(nodes / total) if total else None,
+            'p50': _percentile(latencies, 0.50), 'p95': _percentile(latencies, 0.95),
+            'p99': _percentile(latencies, 0.99),
+            'peak_alloc_kb': peak_alloc // 1024 if trace_memory else None,
+            'peak_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else None,
+            'by_depth': {depth: sum(times) / len(times) for depth, times in sorted(by_depth.items())}}
+
+
+def run_benchmarks(corpus, configs=BENCH_CONFIGS, trace_memory=True, time_limit=None, profile_dir=None,
+                   repeat=BENCH_REPEAT):
+    """Yields one result dict per configuration, each measured in a fresh process.
+
+    Every configuration is checked before the first one runs; a malformed one raises ValueError.
+    """
+    for config in configs:
+        bench_options(config)
+    if profile_dir:
+        os.makedirs(profile_dir, exist_ok=True)
+    for config in configs:
+        with ProcessPoolExecutor(1) as pool:
+            yield pool.submit(_bench_configuration, corpus, config, trace_memory, time_limit, profile_dir,
+                              repeat).result()
+
+
+def time_open_lists(pushes=300000, seed=0):
+    """Nanoseconds per push or pop for each OPEN_LISTS kind, replaying the same simulated A* run.
+
+    Every pop pushes two or three children one move deeper whose f stays the same or grows by 2, as with a
+    consistent heuristic on a sliding puzzle, so most entries tie on f.
+    """
+    rng = random.Random(seed)
+    children = [(rng.choice((0, 0, 2)), rng.getrandbits(60)) for _ in range(pushes)]  # drawn outside the timing
+    results = {}
+    for kind in OPEN_LISTS:
+        push, pop, entries = _open_list(kind)
+        push((20, 0, 0, 0))
+        operations, next_child = 1, 0
+        start = time.perf_counter()
+        while next_child < pushes:
+            f, g, _, _ = pop()
+            for step, code in children[next_child:next_child + 2 + next_child % 2]:
+                push((f + step, g + 1, code, 0))
+            operations += 1 + min(2 + next_child % 2, pushes - next_child)
+            next_child += 2 + next_child % 2
+        while entries:
+            pop()
+            operations += 1
+        results[kind] = round((time.perf_counter() - start) / operations * 1e9)
+    return results
+
+
+def _solve_time(result, metric):
+    """Seconds per solve behind a timing metric: the percentile itself, or the mean solve for nodes_per_sec."""
+    return result[metric] if metric != 'nodes_per_sec' else result['seconds'] / result['puzzles']
+
+
+def compare_benchmarks(baseline, current, threshold=0.10, noise_floor=BENCH_NOISE_FLOOR):
+    """Lists (config, metric, old, new) for every metric that got worse by more than threshold (a fraction).
+
+    A timing metric (see BENCH_TIMING_METRICS) is only flagged if its solves also got more than noise_floor
+    seconds slower, so jitter on sub-millisecond solves is not reported; node counts and allocations are
+    compared by threshold alone.
+    """
+    if any(baseline.get(key) != current.get(key) for key in BENCH_CORPUS_KEYS):
+        raise ValueError(f"Baseline was measured on a different corpus ({', '.join(BENCH_CORPUS_KEYS)} differ)")
+    old_results = {result['config']: result for result in baseline['results']}
+    regressions = []
+    for result in current['results']:
+        old = old_results.get(result['config'])
+        if old is None:
+            continue
+        for metric, direction in BENCH_METRICS.items():
+            before, after = old.get(metric), result.get(metric)
+            if not before or after is None or (after - before) * direction / before <= threshold:
+                continue
+            if metric in BENCH_TIMING_METRICS and _solve_time(result, metric) - _solve_time(old, metric) <= noise_floor:
+                continue
+            regressions.append((result['config'], metric, before, after))
+    return regressions
@@ -0,0 +1,164 @@
+"""Boards: goal lookups, the packed-integer state encoding, solvability and small path helpers."""
+import random
+
+
+# --- Solver Logic (Works with Custom Goal State) ---
+
+def get_goal_positions(goal_state):
+    """Creates a dictionary mapping tile values to their (row, col) coordinates for quick lookup."""
+    positions = {}
+    for r, row in enumerate(goal_state):
+        for c, tile in enumerate(row):
+            positions[tile] = (r, c)
+    return positions
+
+
+def calculate_manhattan_distance(state, goal_positions):
+    """Calculates Manhattan distance for a given state against custom goal positions."""
+    distance = 0
+    for r in range(len(state)):
+        for c in range(len(state)):
+            tile = state[r][c]
+            if tile != 0:
+                goal_r, goal_c = goal_positions[tile]
+                distance += abs(r - goal_r) + abs(c - goal_c)
+    return distance
+
+
+# --- Packed State Engine ---
+# A size x size board is packed into one integer, cell i = row * size + col living in bits
+# [i * bits, (i + 1) * bits). With 4 bits per cell a 3x3 state fits in 36 bits and a 4x4 state in 64 bits;
+# 5x5 boards need 5 bits per cell. States can be hashed, compared and stored without building lists or tuples.
+
+SUPPORTED_SIZES = (3, 4, 5)
+_geometries = {}
+
+
+def board_geometry(size):
+    """Returns (bits per cell, cell mask, neighbour cells of every cell) for a size x size board."""
+    if size not in _geometries:
+        bits = max(4, (size * size - 1).bit_length())
+        neighbors = tuple(
+            tuple((r + dr) * size + (c + dc) for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]
+                  if 0 <= r + dr < size and 0 <= c + dc < size)
+            for r in range(size) for c in range(size))
+        _geometries[size] = (bits, (1 << bits) - 1, neighbors)
+    return _geometries[size]
+
+
+CELL_BITS, CELL_MASK, NEIGHBORS = board_geometry(3)
+
+
+def encode_state(state):
+    """Packs a board (list of rows) into a single integer."""
+    bits = board_geometry(len(state))[0]
+    code = 0
+    for i, tile in enumerate(tile for row in state for tile in row):
+        code |= tile << (i * bits)
+    return code
+
+
+def decode_state(code, size=3):
+    """Unpacks an integer produced by encode_state back into a list of rows."""
+    bits, mask, _ = board_geometry(size)
+    flat = [(code >> (i * bits)) & mask for i in range(size * size)]
+    return [flat[r * size:r * size + size] for r in range(size)]
+
+
+def _manhattan_table(goal_state):
+    """Precomputes distance[tile][cell] against the goal so a packed state can be scored without a dict lookup."""
+    size = len(goal_state)
+    goal_positions = get_goal_positions(goal_state)
+    table = [[0] * (size * size) for _ in range(size * size)]
+    for tile, (goal_r, goal_c) in goal_positions.items():
+        if tile != 0:
+            for cell in range(size * size):
+                table[tile][cell] = abs(cell // size - goal_r) + abs(cell % size - goal_c)
+    return table
+
+
+def _packed_manhattan(code, table, bits):
+    mask = (1 << bits) - 1
+    distance = 0
+    for cell in range(len(table)):
+        distance += table[(code >> (cell * bits)) & mask][cell]
+    return distance
+
+
+def _reconstruct_path(parents, code, size=3):
+    """Walks the parent map back from the goal and returns the path as a list of boards."""
+    path = []
+    while code is not None:
+        path.append(decode_state(code, size))
+        code = parents[code]
+    path.reverse()
+    return path
+
+
+# --- Helper Functions ---
+def find_blank(state):
+    for r in range(len(state)):
+        for c in range(len(state)):
+            if state[r][c] == 0: return (r, c)
+    return None
+
+
+def default_goal(size=3):
+    """Tiles in reading order with the blank in the bottom-right corner."""
+    tiles = list(range(1, size * size)) + [0]
+    return [tiles[r * size:r * size + size] for r in range(size)]
+
+
+def count_inversions(flat):
+    """Counts pairs of tiles (ignoring the blank) that appear in the wrong order."""
+    n = len(flat)
+    return sum(1 for i in range(n) for j in range(i + 1, n) if flat[i] and flat[j] and flat[i] > flat[j])
+
+
+def _parity(state):
+    # Odd widths: a vertical move jumps the tile over an even number of others, so inversion parity is fixed.
+    # Even widths: a vertical move flips inversion parity and changes the blank's row, so their sum is fixed.
+    flat = [num for row in state for num in row]
+    parity = count_inversions(flat)
+    if len(state) % 2 == 0:
+        parity += flat.index(0) // len(state)
+    return parity % 2
+
+
+def is_solvable(initial_state, goal_state):
+    """A board can reach the goal only if both have the same parity (inversions, plus blank row on even widths)."""
+    return len(initial_state) == len(goal_state) and _parity(initial_state) == _parity(goal_state)
+
+
+def generate_random_puzzle(moves=50, size=3, goal_state=None):
+    """Random walk of the blank away from the goal that never immediately undoes its last move."""
+    state = [row[:] for row in goal_state] if goal_state else default_goal(size)
+    size, previous = len(state), None
+    for _ in range(moves):
+        blank_r, blank_c = find_blank(state)
+        possible_moves = []
+        for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+            new_r, new_c = blank_r + dr, blank_c + dc
+            if 0 <= new_r < size and 0 <= new_c < size and (new_r, new_c) != previous:
+                possible_moves.append((new_r, new_c))
+        if possible_moves:
+            new_r, new_c = random.choice(possible_moves)
+            state[blank_r][blank_c], state[new_r][new_c] = state[new_r][new_c], state[blank_r][blank_c]
+            previous = (blank_r, blank_c)
+    return state
+
+
+def tile_moves(path):
+    """(tile, from cell, to cell) for every step of a path of boards, with cells numbered in reading order."""
+    blanks = [[tile for row in board for tile in row].index(0) for board in path]
+    return [([tile for row in path[step] for tile in row][blanks[step + 1]], blanks[step + 1], blanks[step])
+            for step in range(len(path) - 1)]
+
+
+def is_valid_board(state):
+    """True if state is a square list of rows of a supported size holding each of 0..n*n-1 exactly once."""
+    if not isinstance(state, list) or len(state) not in SUPPORTED_SIZES:
+        return False
+    size = len(state)
+    return all(isinstance(row, list) and len(row) == size for row in state) and \
+        sorted(tile for row in state for tile in row if isinstance(tile, int)) == list(range(size * size))
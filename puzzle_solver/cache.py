@@ -0,0 +1,147 @@
+"""Solution cache: an in-process LRU in front of an SQLite file."""
+import threading
+import time
+import sqlite3
+from collections import OrderedDict
+
+from .board import encode_state, find_blank
+from .search import SUBOPTIMAL_SOLVERS, solve_puzzle
+
+
+# --- Solution Cache ---
+# Solutions are stored as the blank's moves ('U', 'D', 'L', 'R'), one letter per step, keyed on the packed
+# (initial, goal) pair. A bounded in-process LRU sits in front of an SQLite file that survives restarts and is
+# trimmed back under a byte budget by dropping the least recently used entries.
+
+BLANK_MOVES = {'U': (-1, 0), 'D': (1, 0), 'L': (0, -1), 'R': (0, 1)}
+
+
+def path_to_moves(path):
+    """Turns a list of boards into a string of blank moves."""
+    moves = []
+    for before, after in zip(path, path[1:]):
+        (r1, c1), (r2, c2) = find_blank(before), find_blank(after)
+        moves.append('UDLR'[[(-1, 0), (1, 0), (0, -1), (0, 1)].index((r2 - r1, c2 - c1))])
+    return ''.join(moves)
+
+
+def moves_to_path(initial_state, moves):
+    """Replays a string of blank moves from initial_state and returns the list of boards."""
+    state = [row[:] for row in initial_state]
+    path = [state]
+    blank_r, blank_c = find_blank(state)
+    for move in moves:
+        dr, dc = BLANK_MOVES[move]
+        state = [row[:] for row in state]
+        state[blank_r][blank_c], state[blank_r + dr][blank_c + dc] = state[blank_r + dr][blank_c + dc], 0
+        blank_r, blank_c = blank_r + dr, blank_c + dc
+        path.append(state)
+    return path
+
+
+class SolutionCache:
+    """Two-tier (memory LRU, then SQLite) cache of optimal solutions keyed on (initial_state, goal_state)."""
+
+    def __init__(self, filename='puzzle_cache.sqlite3', memory_entries=4096, disk_bytes=64 * 1024 * 1024):
+        self.memory, self.memory_entries, self.disk_bytes = OrderedDict(), memory_entries, disk_bytes
+        self.hits = self.misses = self.evictions = 0
+        self.lock = threading.Lock()
+        self.db, self.disk_used = None, 0
+        try:
+            self.db = sqlite3.connect(filename, timeout=30, check_same_thread=False)
+            self.db.execute('PRAGMA journal_mode=WAL')
+            self.db.execute('CREATE TABLE IF NOT EXISTS solutions '
+                            '(key TEXT PRIMARY KEY, moves TEXT NOT NULL, used REAL NOT NULL)')
+            self.db.execute('CREATE INDEX IF NOT EXISTS solutions_used ON solutions (used)')
+            self.db.commit()
+            self.disk_used = self._disk_total()
+        except sqlite3.Error:
+            print("Warning: Could not open the solution cache; caching in memory only.")
+            self.db = None
+
+    @staticmethod
+    def key(initial_state, goal_state):
+        return f"{len(initial_state)}:{encode_state(initial_state):x}:{encode_state(goal_state):x}"
+
+    def get(self, initial_state, goal_state):
+        """Returns the cached move string, or None on a miss."""
+        key = self.key(initial_state, goal_state)
+        with self.lock:
+            if key in self.memory:
+                self.memory.move_to_end(key)
+                self.hits += 1
+                return self.memory[key]
+            row = None
+            if self.db is not None:
+                try:
+                    row = self.db.execute('SELECT moves FROM solutions WHERE key = ?', (key,)).fetchone()
+                    if row:
+                        self.db.execute('UPDATE solutions SET used = ? WHERE key = ?', (time.time(), key))
+                        self.db.commit()
+                except sqlite3.Error:
+                    row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._remember(key, row[0])
+            return row[0]
+
+    def put(self, initial_state, goal_state, moves):
+        key = self.key(initial_state, goal_state)
+        with self.lock:
+            self._remember(key, moves)
+            if self.db is None:
+                return
+            try:
+                # Another worker may have stored this board already; only the size difference is new.
+                old = self.db.execute('SELECT LENGTH(key) + LENGTH(moves) FROM solutions WHERE key = ?',
+                                      (key,)).fetchone()
+                self.db.execute('INSERT INTO solutions VALUES (?, ?, ?) ON CONFLICT(key) DO UPDATE '
+                                'SET moves = excluded.moves, used = excluded.used', (key, moves, time.time()))
+                self.disk_used += len(key) + len(moves) - (old[0] if old else 0)
+                if self.disk_used > self.disk_bytes:
+                    self._trim_disk()
+                self.db.commit()
+            except sqlite3.Error:
+                pass
+
+    def _remember(self, key, moves):
+        self.memory[key] = moves
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.memory_entries:
+            self.memory.popitem(last=False)
+            self.evictions += 1
+
+    def _trim_disk(self):
+        # Count the least recently used rows that bring the store back under nine tenths of the budget, then
+        # drop them in one statement. Other processes write to the same file, so the total is re-read from it.
+        target = self.disk_bytes * 9 // 10
+        used = self._disk_total()
+        doomed = 0
+        for (size,) in self.db.execute('SELECT LENGTH(key) + LENGTH(moves) FROM solutions ORDER BY used'):
+            if used <= target:
+                break
+            doomed += 1
+            used -= size
+        self.db.execute('DELETE FROM solutions WHERE key IN (SELECT key FROM solutions ORDER BY used LIMIT ?)',
+                        (doomed,))
+        self.evictions += doomed
+        self.disk_used = self._disk_total()
+
+    def _disk_total(self):
+        return self.db.execute('SELECT COALESCE(SUM(LENGTH(key) + LENGTH(moves)), 0) FROM solutions').fetchone()[0]
+
+    def solve(self, initial_state, goal_state, callback=None, **options):
+        """solve_puzzle with the cache in front; a hit returns the replayed path and 0 nodes explored."""
+        moves = self.get(initial_state, goal_state)
+        if moves is not None:
+            return moves_to_path(initial_state, moves), 0
+        path, nodes = solve_puzzle(initial_state, goal_state, callback, **options)
+        if path is not None and options.get('algorithm') not in SUBOPTIMAL_SOLVERS:
+            self.put(initial_state, goal_state, path_to_moves(path))
+        return path, nodes
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                'memory_entries': len(self.memory), 'disk_bytes': self.disk_used}
@@ -0,0 +1,219 @@
+"""Command line: the batch, bench and generate commands, or the GUI when no command is given."""
+import json
+import sys
+import argparse
+import asyncio
+from datetime import datetime
+
+from .board import SUPPORTED_SIZES, default_goal, is_valid_board
+from .heuristics import HEURISTICS
+from .search import OPEN_LISTS, SOLVERS
+from .generate import iter_puzzles
+from .batch import solve_batch
+from .bench import (BENCH_CONFIGS, BENCH_NOISE_FLOOR, BENCH_REPEAT, bench_options, build_corpus, run_benchmarks,
+                    compare_benchmarks, time_open_lists)
+from .service import SERVICE_ADDRESS, SERVICE_TIMEOUT, SERVICE_MAX_SOLVE, SolveService
+from .external import external_bfs
+
+
+def _parse_depths(text):
+    """'20' -> 20, '10-20' -> range(10, 21)."""
+    low, _, high = text.partition('-')
+    return range(int(low), int(high) + 1) if high else int(low)
+
+
+def _run_generate(args):
+    goal_state = json.loads(args.goal) if args.goal else None
+    if goal_state is not None and (not is_valid_board(goal_state) or len(goal_state) != args.size):
+        sys.exit("--goal must be a valid board of the chosen --size")
+    try:
+        depth = _parse_depths(args.depth) if args.depth else None
+        puzzles = iter_puzzles(args.count or None, args.size, depth, goal_state, args.seed)
+        sink = sys.stdout if args.output == '-' else open(args.output, 'w')
+        try:
+            for board, d in puzzles:
+                record = {'initial': board}
+                if goal_state:
+                    record['goal'] = goal_state
+                if d is not None:
+                    record['depth'] = d
+                sink.write(json.dumps(record, separators=(',', ':')) + '\n')
+        finally:
+            if sink is not sys.stdout:
+                sink.close()
+    except ValueError as e:
+        sys.exit(str(e))
+
+
+def _run_batch(args):
+    goal_state = json.loads(args.goal) if args.goal else None
+    if goal_state is not None and not is_valid_board(goal_state):
+        sys.exit("--goal must be an NxN board (N = 3, 4 or 5) holding 0..N*N-1 once each")
+    options = {'algorithm': args.algorithm, 'heuristic': args.heuristic, 'max_nodes': args.max_nodes,
+               'time_limit': args.time_limit}
+    if args.algorithm == 'astar':
+        options['open_list'] = args.open_list
+    source = sys.stdin if args.input == '-' else open(args.input)
+    sink = sys.stdout if args.output == '-' else open(args.output, 'w')
+    failed = 0
+    try:
+        for result in solve_batch(source, goal_state, args.workers, not args.unordered, args.chunk_size,
+                                  with_path=args.with_path, cache_file=args.cache, **options):
+            failed += 'error' in result
+            sink.write(json.dumps(result, separators=(',', ':')) + '\n')
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+    if failed:
+        print(f"{failed} line(s) could not be solved; see their 'error' field.", file=sys.stderr)
+
+
+def _run_bench(args):
+    if args.open_lists:
+        for kind, nanoseconds in time_open_lists().items():
+            print(f"{kind:<8}{nanoseconds:>6} ns per push/pop")
+        return
+    configs = args.config or BENCH_CONFIGS
+    try:
+        for config in configs:
+            bench_options(config)
+    except ValueError as e:
+        sys.exit(str(e))
+    corpus = build_corpus(args.per_depth, args.seed, max_depth=args.max_depth)
+    report = {'date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'), 'python': sys.version.split()[0],
+              'platform': sys.platform, 'seed': args.seed, 'per_depth': args.per_depth, 'max_depth': args.max_depth,
+              'repeat': args.repeat, 'results': []}
+    print(f"{'config':<26}{'nodes/s':>10}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'nodes':>10}{'last f':>9}"
+          f"{'alloc KiB':>11}{'RSS KiB':>9}", file=sys.stderr)
+    for result in run_benchmarks(corpus, configs, not args.no_memory, args.time_limit,
+                                 args.profile, args.repeat):
+        report['results'].append(result)
+        print(f"{result['config']:<26}{result['nodes_per_sec'] or 0:>10}{result['p50'] * 1000:>9.2f}"
+              f"{result['p95'] * 1000:>9.2f}{result['p99'] * 1000:>9.2f}{result['nodes']:>10}"
+              f"{result['final_layer'] if result['final_layer'] is not None else '-':>9}"
+              f"{result['peak_alloc_kb'] or '-':>11}{result['peak_rss_kb'] or '-':>9}", file=sys.stderr)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        try:
+            regressions = compare_benchmarks(baseline, report, args.threshold, args.noise_floor / 1000)
+        except ValueError as e:
+            sys.exit(str(e))
+        for config, metric, before, after in regressions:
+            print(f"REGRESSION {config} {metric}: {before:.6g} -> {after:.6g}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+def _run_serve(args):
+    service = SolveService(args.workers, args.max_pending, args.timeout, args.max_solve_time, args.cache)
+    print(f"Serving on {args.address} with {service.workers} workers (Ctrl-C to stop)", file=sys.stderr)
+    try:
+        asyncio.run(service.serve(args.address))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.close()
+
+
+def _run_bfs(args):
+    goal_state = json.loads(args.goal) if args.goal else default_goal(args.size)
+    if not is_valid_board(goal_state) or len(goal_state) != args.size:
+        sys.exit("--goal must be a valid board of the chosen --size")
+
+    def report(depth, count):
+        print(json.dumps({'depth': depth, 'states': count}), flush=True)
+    try:
+        counts = external_bfs(goal_state, args.directory, int(args.memory * 1024 * 1024), args.max_depth,
+                              args.keep_layers, report)
+    except ValueError as e:
+        sys.exit(str(e))
+    print(f"{sum(counts)} states in {len(counts)} layers (depth 0-{len(counts) - 1})", file=sys.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sliding puzzle solver (3x3 to 5x5). Runs the GUI unless a command "
+                                                 "is given.")
+    parser.add_argument('--service', metavar='ADDRESS', help="GUI: solve through a running 'serve' instance")
+    commands = parser.add_subparsers(dest='command')
+    batch = commands.add_parser('batch', help="solve puzzles from JSON lines without the GUI")
+    batch.add_argument('input', nargs='?', default='-', help="JSONL file of puzzles (default: stdin)")
+    batch.add_argument('-o', '--output', default='-', help="where to write JSONL results (default: stdout)")
+    batch.add_argument('-g', '--goal', help="default goal state as JSON (default: tiles in order, blank last)")
+    batch.add_argument('-a', '--algorithm', default='astar', choices=list(SOLVERS))
+    batch.add_argument('--heuristic', default='manhattan', choices=list(HEURISTICS))
+    batch.add_argument('--open-list', default='bucket', choices=OPEN_LISTS, help="A* open-list structure")
+    batch.add_argument('-w', '--workers', type=int, default=None, help="worker processes (default: CPU count)")
+    batch.add_argument('--chunk-size', type=int, default=64, help="puzzles per task sent to a worker")
+    batch.add_argument('--unordered', action='store_true', help="write results as they finish")
+    batch.add_argument('--with-path', action='store_true', help="include the list of boards in each result")
+    batch.add_argument('--cache', metavar='FILE', help="reuse and store solutions in this SQLite cache file")
+    batch.add_argument('--time-limit', type=float, metavar='SECONDS', help="give up on a puzzle after this long")
+    batch.add_argument('--max-nodes', type=int, help="give up on a puzzle after expanding this many nodes")
+    bench = commands.add_parser('bench', help="benchmark solver configurations on a depth-stratified corpus")
+    bench.add_argument('-o', '--output', help="save the results as a JSON baseline")
+    bench.add_argument('--baseline', help="compare against this saved baseline; exit 1 on regressions")
+    bench.add_argument('--threshold', type=float, default=0.10, help="allowed slowdown before flagging (0.10 = 10%%)")
+    bench.add_argument('--noise-floor', type=float, default=BENCH_NOISE_FLOOR * 1000, metavar='MS',
+                       help="smallest latency increase flagged, however large in relative terms")
+    bench.add_argument('--repeat', type=int, default=BENCH_REPEAT,
+                       help="timed solves per puzzle; the fastest is kept (default: %(default)s)")
+    bench.add_argument('-c', '--config', action='append', metavar='ALGORITHM[:HEURISTIC[:OPEN_LIST]]',
+                       help=f"configuration to run, repeatable (default: {' '.join(BENCH_CONFIGS)})")
+    bench.add_argument('--per-depth', type=int, default=3, help="puzzles per optimal depth and goal state")
+    bench.add_argument('--max-depth', type=int, default=31, help="deepest optimal depth in the corpus")
+    bench.add_argument('--seed', type=int, default=0, help="corpus seed")
+    bench.add_argument('--time-limit', type=float, metavar='SECONDS', help="give up on a puzzle after this long")
+    bench.add_argument('--no-memory', action='store_true', help="skip the tracemalloc pass")
+    bench.add_argument('--profile', metavar='DIR', help="save cProfile stats per configuration here (slows timings)")
+    bench.add_argument('--open-lists', action='store_true', help="only time push/pop of each A* open-list structure")
+    generate = commands.add_parser('generate', help="stream random solvable puzzles as JSON lines (batch input)")
+    generate.add_argument('-n', '--count', type=int, default=1000, help="how many puzzles (0 = endless)")
+    generate.add_argument('--size', type=int, default=3, choices=SUPPORTED_SIZES)
+    generate.add_argument('-d', '--depth', help="exact optimal depth, or a range such as 10-20 to cycle through "
+                                                "(3x3 only; default: uniform over all solvable boards)")
+    generate.add_argument('-g', '--goal', help="goal state as JSON (default: tiles in order, blank last)")
+    generate.add_argument('--seed', type=int, help="seed for a reproducible stream")
+    generate.add_argument('-o', '--output', default='-', help="where to write JSONL puzzles (default: stdout)")
+    serve = commands.add_parser('serve', help="run a local solve service (JSON lines over a socket)")
+    serve.add_argument('address', nargs='?', default=SERVICE_ADDRESS,
+                       help=f"host:port or a Unix socket path (default: {SERVICE_ADDRESS})")
+    serve.add_argument('-w', '--workers', type=int, default=None, help="worker processes (default: CPU count)")
+    serve.add_argument('--max-pending', type=int, help="distinct solves queued or running before new ones are "
+                                                       "refused (default: 8 per worker)")
+    serve.add_argument('--timeout', type=float, default=SERVICE_TIMEOUT, metavar='SECONDS',
+                       help="how long a request waits for its result unless it sets 'timeout'")
+    serve.add_argument('--max-solve-time', type=float, default=SERVICE_MAX_SOLVE, metavar='SECONDS',
+                       help="wall-clock cap on every solve")
+    serve.add_argument('--cache', metavar='FILE', help="reuse and store solutions in this SQLite cache file")
+    bfs = commands.add_parser('bfs', help="breadth-first search from the goal on disk; prints states per depth")
+    bfs.add_argument('directory', help="where the layer files go; rerun with the same one to resume")
+    bfs.add_argument('--size', type=int, default=3, choices=(3, 4))
+    bfs.add_argument('-g', '--goal', help="goal state as JSON (default: tiles in order, blank last)")
+    bfs.add_argument('--max-depth', type=int, help="stop after this layer (default: until a layer is empty)")
+    bfs.add_argument('--memory', type=float, default=256, metavar='MIB', help="cap on states buffered in memory")
+    bfs.add_argument('--keep-layers', action='store_true', help="keep every layer file, not just the last two")
+    args = parser.parse_args(argv)
+
+    if args.command == 'batch':
+        _run_batch(args)
+    elif args.command == 'bench':
+        _run_bench(args)
+    elif args.command == 'generate':
+        _run_generate(args)
+    elif args.command == 'serve':
+        _run_serve(args)
+    elif args.command == 'bfs':
+        _run_bfs(args)
+    else:
+        import tkinter as tk  # only the GUI needs Tk; the commands above never load it
+        from .gui import ProfessionalPuzzleGUI
+        root = tk.Tk()
+        ProfessionalPuzzleGUI(root, args.service)
+        root.mainloop()
+
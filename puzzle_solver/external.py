@@ -0,0 +1,158 @@
+"""Breadth-first search from a goal with its layers on disk, for state spaces too big to hold in memory."""
+import glob
+import heapq
+import json
+import mmap
+import os
+from array import array
+
+from .board import board_geometry, encode_state
+
+
+# --- External-Memory Breadth-First Search ---
+# Each finished layer is a file of sorted, unique packed states (8 bytes each). Children of layer d are
+# collected in memory until the cap, sorted and spilled as a run file; the runs are then merged, and because a
+# sliding puzzle's moves always change depth by exactly one, merging against layer d - 1 is all it takes to
+# drop every state seen before. progress.json is rewritten after each layer, so an interrupted search resumes
+# from the last finished layer.
+
+EXTERNAL_MEMORY_LIMIT = 256 * 1024 * 1024  # default cap, in bytes, on states buffered before a run is spilled
+BYTES_PER_BUFFERED_STATE = 96  # an int in the array, its set entry and its sorted-list copy while spilling
+READ_CHUNK = 1 << 16  # most states copied out of a memory-mapped file at a time
+PROGRESS_FILE = 'progress.json'
+
+
+def _layer_path(directory, depth):
+    return os.path.join(directory, f'layer_{depth:03d}.states')
+
+
+def _read_states(path, chunk=READ_CHUNK):
+    """Yields the states of a layer or run file in order, copying chunk of them at a time out of a memory map."""
+    if not os.path.getsize(path):
+        return
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        view = memoryview(mapped).cast('Q')
+        try:
+            for start in range(0, len(view), chunk):
+                yield from view[start:start + chunk].tolist()
+        finally:
+            view.release()
+
+
+def _write_states(path, states):
+    """Writes sorted states to path (through a temporary file, so a crash never leaves half a file) and
+    returns how many were written."""
+    count, chunk = 0, array('Q')
+    with open(path + '.tmp', 'wb') as f:
+        for code in states:
+            chunk.append(code)
+            if len(chunk) >= READ_CHUNK:
+                chunk.tofile(f)
+                count += len(chunk)
+                del chunk[:]
+        chunk.tofile(f)
+        count += len(chunk)
+    os.replace(path + '.tmp', path)
+    return count
+
+
+def _merge_new_states(run_paths, previous_path, buffer_limit):
+    """Merges sorted runs, dropping repeats and every state that is also in the previous layer."""
+    chunk = max(256, min(READ_CHUNK, buffer_limit // (len(run_paths) + 1)))  # the readers share the memory cap
+    previous = _read_states(previous_path, chunk) if previous_path else iter(())
+    seen, last = next(previous, None), None
+    for code in heapq.merge(*(_read_states(path, chunk) for path in run_paths)):
+        if code == last:
+            continue
+        last = code
+        while seen is not None and seen < code:
+            seen = next(previous, None)
+        if code != seen:
+            yield code
+
+
+def _expand_layer(directory, depth, size, buffer_limit):
+    """Writes layer depth + 1 from layers depth and depth - 1 and returns its state count."""
+    bits, mask, neighbors = board_geometry(size)
+    cells = size * size
+    runs, buffer = [], array('Q')
+
+    def spill():
+        runs.append(os.path.join(directory, f'next_{len(runs):04d}.run'))
+        _write_states(runs[-1], sorted(set(buffer)))
+        del buffer[:]
+
+    for code in _read_states(_layer_path(directory, depth), min(READ_CHUNK, buffer_limit // 4)):
+        blank = next(cell for cell in range(cells) if not (code >> cell * bits) & mask)
+        blank_shift = blank * bits
+        for cell in neighbors[blank]:
+            shift = cell * bits
+            tile = (code >> shift) & mask
+            buffer.append(code - (tile << shift) + (tile << blank_shift))
+        if len(buffer) >= buffer_limit:
+            spill()
+    if buffer or not runs:
+        spill()
+    count = _write_states(_layer_path(directory, depth + 1),
+                          _merge_new_states(runs, _layer_path(directory, depth - 1) if depth else None, buffer_limit))
+    for path in runs:
+        os.remove(path)
+    return count
+
+
+def _save_progress(directory, progress):
+    path = os.path.join(directory, PROGRESS_FILE)
+    with open(path + '.tmp', 'w') as f:
+        json.dump(progress, f)
+    os.replace(path + '.tmp', path)
+
+
+def external_bfs(goal_state, directory, memory_limit=EXTERNAL_MEMORY_LIMIT, max_depth=None, keep_layers=False,
+                 on_layer=None):
+    """Breadth-first search from goal_state with sorted layer files in directory; returns states per depth.
+
+    At most memory_limit bytes of states are buffered at once. If directory already holds a search from the
+    same goal, it carries on from the last finished layer. on_layer(depth, count) is called for every layer,
+    including those loaded from an earlier run. Only the last two layers are kept unless keep_layers is set.
+    The search stops after max_depth, or when a layer comes out empty (the histogram is then complete).
+    """
+    size = len(goal_state)
+    if board_geometry(size)[0] * size * size > 64:
+        raise ValueError("External search stores states in 64 bits, so it supports 3x3 and 4x4 boards")
+    os.makedirs(directory, exist_ok=True)
+    for stale in glob.glob(os.path.join(directory, '*.run')) + glob.glob(os.path.join(directory, '*.tmp')):
+        os.remove(stale)  # left over from an interrupted layer
+    progress_path = os.path.join(directory, PROGRESS_FILE)
+    if os.path.exists(progress_path):
+        with open(progress_path) as f:
+            progress = json.load(f)
+        if progress['goal'] != goal_state:
+            raise ValueError(f"{directory} holds a search for another goal state: {progress['goal']}")
+    else:
+        _write_states(_layer_path(directory, 0), [encode_state(goal_state)])
+        progress = {'goal': goal_state, 'counts': [1], 'complete': False}
+        _save_progress(directory, progress)
+    counts = progress['counts']
+    if not keep_layers:  # an interruption between saving progress and deleting the oldest layer leaves it behind
+        for path in glob.glob(os.path.join(directory, 'layer_*.states')):
+            if int(os.path.basename(path)[6:9]) < len(counts) - 2:
+                os.remove(path)
+    if on_layer:
+        for depth, count in enumerate(counts):
+            on_layer(depth, count)
+
+    buffer_limit = max(1024, memory_limit // BYTES_PER_BUFFERED_STATE)
+    while not progress['complete'] and (max_depth is None or len(counts) <= max_depth):
+        depth = len(counts) - 1
+        count = _expand_layer(directory, depth, size, buffer_limit)
+        if count:
+            counts.append(count)
+        else:
+            os.remove(_layer_path(directory, depth + 1))
+            progress['complete'] = True
+        _save_progress(directory, progress)
+        if count and not keep_layers and depth:
+            os.remove(_layer_path(directory, depth - 1))
+        if count and on_layer:
+            on_layer(depth + 1, count)
+    return counts
@@ -0,0 +1,82 @@
+"""Seeded streams of random solvable puzzles, optionally at an exact optimal depth."""
+import threading
+import random
+import itertools
+from array import array
+
+from .board import CELL_BITS, CELL_MASK, default_goal, is_solvable
+from .tables import TABLE_HEADER, TABLE_SIZE, UNREACHABLE, _reference_goal, load_distance_table
+
+
+# --- Puzzle Generation ---
+# Exact-depth 3x3 puzzles are drawn from the distance table: every Lehmer rank at the wanted distance is listed
+# once per goal blank cell, and a uniformly chosen rank is unranked and relabelled to the goal's tiles.
+
+_depth_classes = {}
+_depth_classes_lock = threading.Lock()
+FACTORIALS = [1, 1, 2, 6, 24, 120, 720, 5040, 40320]
+
+
+def permutation_unrank(rank):
+    """Inverse of permutation_rank: the packed state with the given Lehmer rank."""
+    remaining, code = list(range(9)), 0
+    for cell in range(9):
+        index, rank = divmod(rank, FACTORIALS[8 - cell])
+        code |= remaining.pop(index) << (cell * CELL_BITS)
+    return code
+
+
+def depth_classes(blank_cell):
+    """Ranks of all states at each optimal distance from the reference goal with the blank at blank_cell."""
+    with _depth_classes_lock:
+        if blank_cell not in _depth_classes:
+            table = load_distance_table(blank_cell)
+            classes = {}
+            for rank, distance in enumerate(table[TABLE_HEADER.size:TABLE_HEADER.size + TABLE_SIZE]):
+                if distance != UNREACHABLE:
+                    classes.setdefault(distance, array('I')).append(rank)
+            _depth_classes[blank_cell] = [classes[d] for d in range(len(classes))]
+        return _depth_classes[blank_cell]
+
+
+def random_solvable_state(goal_state, rng=random):
+    """A board drawn uniformly from all boards that can reach goal_state (any supported size)."""
+    size = len(goal_state)
+    tiles = list(range(size * size))
+    rng.shuffle(tiles)
+    if not is_solvable([tiles[r * size:(r + 1) * size] for r in range(size)], goal_state):
+        # Swapping two tiles (not the blank) flips solvability, and pairs the two halves one to one.
+        first, second = [cell for cell, tile in enumerate(tiles) if tile][:2]
+        tiles[first], tiles[second] = tiles[second], tiles[first]
+    return [tiles[r * size:(r + 1) * size] for r in range(size)]
+
+
+def iter_puzzles(count=None, size=3, depth=None, goal_state=None, seed=None):
+    """Streams (board, optimal depth) pairs for goal_state (default: the standard goal of that size).
+
+    Without depth, boards are uniform over all solvable boards and their depth is None. With depth (an int or a
+    sequence cycled through, 3x3 only), each board is uniform among those exactly that many moves from the
+    goal. count=None streams forever; seed makes the stream reproducible.
+    """
+    goal_state = goal_state or default_goal(size)
+    rng = random.Random(seed)
+    puzzles = itertools.count() if count is None else range(count)
+    if depth is None:
+        for _ in puzzles:
+            yield random_solvable_state(goal_state, rng), None
+        return
+    if len(goal_state) != 3:
+        raise ValueError("Exact-depth puzzles come from the 3x3 distance table, so they are 3x3 only")
+    depths = [depth] if isinstance(depth, int) else list(depth)
+    flat_goal = [tile for row in goal_state for tile in row]
+    blank = flat_goal.index(0)
+    classes = depth_classes(blank)
+    if any(not 0 <= d < len(classes) for d in depths):
+        raise ValueError(f"3x3 optimal depths run from 0 to {len(classes) - 1}")
+    relabel = [0] * 9  # reference-goal tile -> goal_state tile
+    for cell, tile in enumerate(tile for row in _reference_goal(blank) for tile in row):
+        relabel[tile] = flat_goal[cell]
+    for _, d in zip(puzzles, itertools.cycle(depths)):
+        code = permutation_unrank(rng.choice(classes[d]))
+        tiles = [relabel[(code >> (cell * CELL_BITS)) & CELL_MASK] for cell in range(9)]
+        yield [tiles[0:3], tiles[3:6], tiles[6:9]], d
@@ -0,0 +1,711 @@
+"""The Tk desktop app. Importing this module is what loads tkinter."""
+import tkinter as tk
+from tkinter import messagebox, filedialog, ttk
+import threading
+import time
+import random
+import os
+from collections import OrderedDict
+
+from .board import (get_goal_positions, calculate_manhattan_distance, SUPPORTED_SIZES, default_goal, is_solvable,
+                    generate_random_puzzle, tile_moves)
+from .heuristics import HEURISTICS
+from .search import CancelToken, SearchAborted, TELEMETRY_INTERVAL, SearchTelemetry, SOLVERS
+from .generate import random_solvable_state
+from .cache import SolutionCache
+from .history import HistoryManager
+from .service import request_solve
+from .hints import HintEngine
+
+
+# --- Custom Rounded Button Class (Unchanged) ---
+class RoundedButton(tk.Canvas):
+    def __init__(self, parent, width, height, corner_radius, padding, color, bg, text, command):
+        tk.Canvas.__init__(self, parent, borderwidth=0, relief="flat", highlightthickness=0, bg=bg)
+        self.command, self.color, self.hover_color, self.text = command, color, self._lighten_color(color), text
+        self.width, self.height, self.corner_radius, self.padding = width, height, corner_radius, padding
+        self.text_color = '#ffffff';
+        self.config(width=width, height=height);
+        self._draw()
+        self.bind("<Enter>", self._on_enter);
+        self.bind("<Leave>", self._on_leave);
+        self.bind("<Button-1>", self._on_click)
+
+    def _draw(self, color=None):
+        if color is None: color = self.color
+        self.delete("all")
+        x1, y1, x2, y2, r = self.padding, self.padding, self.width - self.padding, self.height - self.padding, self.corner_radius
+        self.create_oval(x1, y1, x1 + 2 * r, y1 + 2 * r, fill=color, outline=color)
+        self.create_oval(x2 - 2 * r, y1, x2, y1 + 2 * r, fill=color, outline=color)
+        self.create_oval(x1, y2 - 2 * r, x1 + 2 * r, y2, fill=color, outline=color)
+        self.create_oval(x2 - 2 * r, y2 - 2 * r, x2, y2, fill=color, outline=color)
+        self.create_rectangle(x1 + r, y1, x2 - r, y2, fill=color, outline=color)
+        self.create_rectangle(x1, y1 + r, x2, y2 - r, fill=color, outline=color)
+        self.create_text(self.width / 2, self.height / 2, text=self.text, fill=self.text_color,
+                         font=("Segoe UI", 11, "bold"))
+
+    def _on_enter(self, e):
+        self._draw(self.hover_color)
+
+    def _on_leave(self, e):
+        self._draw()
+
+    def _on_click(self, e):
+        if self.command: self.command()
+
+    def _lighten_color(self, color_hex, factor=0.2):
+        r, g, b = int(color_hex[1:3], 16), int(color_hex[3:5], 16), int(color_hex[5:7], 16)
+        r = min(255, int(r + (255 - r) * factor));
+        g = min(255, int(g + (255 - g) * factor));
+        b = min(255, int(b + (255 - b) * factor))
+        return f'#{r:02x}{g:02x}{b:02x}'
+
+
+TIME_LIMITS = {'none': None, '1s': 1, '5s': 5, '30s': 30}  # seconds, for the GUI's time-limit box
+GRADIENT_BUCKET = 64  # background images are rendered for sizes rounded up to this many pixels
+GRADIENT_CACHE_SIZE = 2  # rendered backgrounds kept, e.g. maximized and restored
+GRADIENT_DEBOUNCE_MS = 80
+BOARD_CELL_PX = {3: 104, 4: 84, 5: 66}  # playback board cell size per board size
+BOARD_GAP = 8
+FRAME_MS = 16  # ~60 fps for tile slides
+SLIDE_FRACTION = 0.6  # share of each step (the speed scale) spent sliding; the rest is a pause
+HINT_RECHECK_MS = 400  # how soon the difficulty label asks again while the hint search is still warming up
+FIXED_HEURISTICS = {'table': None, 'bidirectional': None, 'vectorized': 'manhattan'}  # modes ignoring the box
+
+
+# --- Enhanced GUI ---
+class ProfessionalPuzzleGUI:
+    def __init__(self, root, service=None):
+        self.root, self.service = root, service  # service: address of a running `serve`, or None to solve here
+        self.root.title("8-Puzzle Solver AI");
+        self.root.minsize(1100, 720)
+        self.theme = {"bg_grad_start": "#141e30", "bg_grad_end": "#243b55", "card": "#2c3e50", "card_border": "#34495e",
+                      "primary": "#00a896", "success": "#02c39a", "warning": "#fbc490", "danger": "#e74c3c",
+                      "purple": "#9b59b6", "text_light": "#ecf0f1", "text_medium": "#bdc3c7", "tile": "#34495e",
+                      "tile_text": "#ecf0f1"}
+        self.fonts = {"title": ("Segoe UI Black", 32, "bold"), "playback_heading": ("Segoe UI", 12, "bold"),
+                      "heading": ("Segoe UI", 14, "bold"), "tile": ("Segoe UI", 38, "bold"), "text": ("Segoe UI", 10),
+                      "stat_label": ("Segoe UI", 10, "bold"), "stat_value": ("Segoe UI", 24, "bold")}
+        self.input_tiles, self.display_tiles = {}, {}
+        self.animation_speed = tk.IntVar(value=300)
+        self.algorithm = tk.StringVar(value='astar')
+        self.heuristic = tk.StringVar(value='manhattan')
+        self.board_size = tk.StringVar(value='3x3')
+        self.time_limit = tk.StringVar(value='none')
+        self.cancel_token, self.animation_job = None, None
+        self.is_solving, self.is_paused, self.sliding = False, False, False
+        self.history, self.solution_path, self.current_step = HistoryManager(), None, 0
+        self.cache = SolutionCache()
+        self.goal_state = default_goal(3)
+        self.hints, self.hint_job = HintEngine(), None
+        self.hints.set_goal(self.goal_state)
+        self.root.geometry(
+            f"1200x800+{(self.root.winfo_screenwidth() - 1200) // 2}+{(self.root.winfo_screenheight() - 800) // 2}")
+        self._create_gradient_background();
+        self.create_ui();
+        self.update_stats_display()
+
+    def _create_gradient_background(self):
+        self.bg_canvas = tk.Canvas(self.root, highlightthickness=0);
+        self.bg_canvas.pack(fill="both", expand=True);
+        self.gradient_images, self.gradient_bucket, self.gradient_job = OrderedDict(), None, None
+        self.gradient_item = self.bg_canvas.create_image(0, 0, anchor='nw')
+        # Only the canvas's own size matters; binding on root would also fire for every child widget.
+        self.bg_canvas.bind("<Configure>", self._on_resize_gradient)
+
+    def _gradient_image(self, width, height):
+        """One gradient column, zoomed to width; cached per size bucket so resizing back and forth is free."""
+        image = self.gradient_images.get((width, height))
+        if image is None:
+            (r1, g1, b1), (r2, g2, b2) = self.root.winfo_rgb(self.theme["bg_grad_start"]), self.root.winfo_rgb(
+                self.theme["bg_grad_end"])
+            r, g, b = float(r2 - r1) / height, float(g2 - g1) / height, float(b2 - b1) / height
+            column = tk.PhotoImage(width=1, height=height)
+            column.put(" ".join(f"{{#{int(r1 + r * i) >> 8:02x}{int(g1 + g * i) >> 8:02x}{int(b1 + b * i) >> 8:02x}}}"
+                                for i in range(height)))
+            image = self.gradient_images[(width, height)] = column.zoom(width, 1)
+            while len(self.gradient_images) > GRADIENT_CACHE_SIZE:
+                self.gradient_images.popitem(last=False)
+        self.gradient_images.move_to_end((width, height))
+        return image
+
+    def _draw_gradient(self, event=None):
+        self.gradient_job = None
+        width, height = self.bg_canvas.winfo_width(), self.bg_canvas.winfo_height()
+        if width < 2 or height < 2: return
+        bucket = (-(-width // GRADIENT_BUCKET) * GRADIENT_BUCKET, -(-height // GRADIENT_BUCKET) * GRADIENT_BUCKET)
+        if bucket == self.gradient_bucket: return
+        self.gradient_bucket = bucket
+        self.bg_canvas.itemconfig(self.gradient_item, image=self._gradient_image(*bucket))
+
+    def _on_resize_gradient(self, event):
+        # Redraw once the size has settled instead of on every intermediate <Configure> while dragging.
+        if self.gradient_job: self.root.after_cancel(self.gradient_job)
+        self.gradient_job = self.root.after(GRADIENT_DEBOUNCE_MS, self._draw_gradient)
+
+    def create_ui(self):
+        header = tk.Frame(self.bg_canvas, bg=self.theme["bg_grad_start"], height=50);
+        header.pack(fill='x', side='top')
+        content_frame = tk.Frame(self.bg_canvas, bg=self.theme["bg_grad_start"]);
+        content_frame.place(relx=0.5, rely=0.5, anchor="center")
+        left = self.create_card(content_frame);
+        left.pack(side='left', fill='y', padx=(0, 25))
+        center = self.create_card(content_frame, width=500);
+        center.pack(side='left', padx=25)
+        right = self.create_card(content_frame);
+        right.pack(side='left', fill='y', padx=(25, 0))
+        tk.Label(left, text="Statistics", font=self.fonts["heading"], bg=self.theme["card"],
+                 fg=self.theme["text_light"]).pack(pady=(25, 15))
+        self.moves_label, self.time_label, self.nodes_label = self.create_stat_row(left, "Moves", "0", self.theme[
+            "primary"]), self.create_stat_row(left, "Time", "0.00s", self.theme["success"]), self.create_stat_row(left,
+                                                                                                                  "Nodes",
+                                                                                                                  "0",
+                                                                                                                  self.theme[
+                                                                                                                      "purple"])
+        self.heuristic_label = tk.Label(left, text="", font=self.fonts["text"], bg=self.theme["card"],
+                                        fg=self.theme["text_medium"], anchor='e')
+        self.heuristic_label.pack(fill='x', padx=30)
+        self.cache_label = self.create_stat_row(left, "Cache", "0/0", self.theme["success"])
+        self.cache_detail_label = tk.Label(left, text="", font=self.fonts["text"], bg=self.theme["card"],
+                                           fg=self.theme["text_medium"], anchor='e')
+        self.cache_detail_label.pack(fill='x', padx=30)
+        tk.Frame(left, bg=self.theme["card_border"], height=1).pack(fill='x', padx=30, pady=20)
+        tk.Label(left, text="Overall", font=self.fonts["heading"], bg=self.theme["card"],
+                 fg=self.theme["text_light"]).pack(pady=(0, 15))
+        self.total_label, self.avg_moves_label, self.best_time_label = self.create_stat_row(left, "Solved", "0",
+                                                                                            self.theme[
+                                                                                                "primary"]), self.create_stat_row(
+            left, "Avg Moves", "--", self.theme["warning"]), self.create_stat_row(left, "Best Time", "--",
+                                                                                  self.theme["danger"])
+        RoundedButton(left, 200, 50, 15, 5, self.theme["primary"], self.theme["card"], "📥 Export History",
+                      self.export_history).pack(side='bottom', pady=(25, 25))
+        self.title_label = tk.Label(center, text="8-PUZZLE SOLVER", font=self.fonts["title"], bg=self.theme["card"],
+                                    fg=self.theme["text_light"])
+        self.title_label.pack(pady=(30, 15))
+        puzzle_inner_frame = tk.Frame(center, bg=self.theme["card"]);
+        puzzle_inner_frame.pack(expand=True)
+        self.input_frame, self.display_frame = tk.Frame(puzzle_inner_frame, bg=self.theme["card"]), tk.Frame(
+            puzzle_inner_frame, bg=self.theme["card"]);
+        self.input_frame.pack()
+        self.create_input_grid();
+        self.create_display_grid()
+        diff_frame = tk.Frame(center, bg=self.theme["card"]);
+        diff_frame.pack(side='bottom', pady=(15, 25))
+        tk.Label(diff_frame, text="Difficulty:", font=self.fonts["text"], bg=self.theme["card"],
+                 fg=self.theme["text_medium"]).pack(side='left', padx=(0, 8))
+        self.difficulty_label = tk.Label(diff_frame, text="--", font=self.fonts["heading"], bg=self.theme["card"],
+                                         fg=self.theme["text_light"]);
+        self.difficulty_label.pack(side='left')
+        controls_inner = tk.Frame(right, bg=self.theme["card"]);
+        controls_inner.pack(fill='both', expand=True, padx=30, pady=30)
+        RoundedButton(controls_inner, 220, 50, 15, 5, self.theme["primary"], self.theme["card"], "🚀 Solve Puzzle",
+                      self.solve_puzzle_threaded).pack(pady=8)
+        RoundedButton(controls_inner, 220, 50, 15, 5, self.theme["purple"], self.theme["card"], "🎲 Random Puzzle",
+                      self.generate_random).pack(pady=8)
+        RoundedButton(controls_inner, 220, 50, 15, 5, self.theme["success"], self.theme["card"], "💡 Hint",
+                      self.show_hint).pack(pady=8)
+        RoundedButton(controls_inner, 220, 50, 15, 5, self.theme["warning"], self.theme["card"], "🎯 Set Goal State",
+                      self.open_goal_state_editor).pack(pady=8)
+        RoundedButton(controls_inner, 220, 50, 15, 5, self.theme["danger"], self.theme["card"], "🔄 Reset Board",
+                      self.reset_board).pack(pady=8)
+        size_frame = tk.Frame(controls_inner, bg=self.theme["card"])
+        size_frame.pack(fill='x', pady=(8, 0))
+        tk.Label(size_frame, text="Board", font=self.fonts["text"], bg=self.theme["card"],
+                 fg=self.theme["text_medium"]).pack(side='left', padx=(5, 0))
+        size_box = ttk.Combobox(size_frame, textvariable=self.board_size,
+                                values=[f"{n}x{n}" for n in SUPPORTED_SIZES], state='readonly', width=12)
+        size_box.pack(side='right', padx=(0, 5))
+        size_box.bind('<<ComboboxSelected>>', lambda e: self.change_board_size())
+        algorithm_frame = tk.Frame(controls_inner, bg=self.theme["card"])
+        algorithm_frame.pack(fill='x', pady=(8, 0))
+        tk.Label(algorithm_frame, text="Algorithm", font=self.fonts["text"], bg=self.theme["card"],
+                 fg=self.theme["text_medium"]).pack(side='left', padx=(5, 0))
+        ttk.Combobox(algorithm_frame, textvariable=self.algorithm, values=list(SOLVERS), state='readonly',
+                     width=12).pack(side='right', padx=(0, 5))
+        heuristic_frame = tk.Frame(controls_inner, bg=self.theme["card"])
+        heuristic_frame.pack(fill='x', pady=(8, 0))
+        tk.Label(heuristic_frame, text="Heuristic", font=self.fonts["text"], bg=self.theme["card"],
+                 fg=self.theme["text_medium"]).pack(side='left', padx=(5, 0))
+        ttk.Combobox(heuristic_frame, textvariable=self.heuristic, values=list(HEURISTICS), state='readonly',
+                     width=12).pack(side='right', padx=(0, 5))
+        time_limit_frame = tk.Frame(controls_inner, bg=self.theme["card"])
+        time_limit_frame.pack(fill='x', pady=(8, 0))
+        tk.Label(time_limit_frame, text="Time limit", font=self.fonts["text"], bg=self.theme["card"],
+                 fg=self.theme["text_medium"]).pack(side='left', padx=(5, 0))
+        ttk.Combobox(time_limit_frame, textvariable=self.time_limit, values=list(TIME_LIMITS), state='readonly',
+                     width=12).pack(side='right', padx=(0, 5))
+        tk.Frame(controls_inner, bg=self.theme["card_border"], height=1).pack(fill='x', padx=0, pady=20)
+        tk.Label(controls_inner, text="Playback Controls", font=self.fonts["playback_heading"], bg=self.theme["card"],
+                 fg=self.theme["text_light"]).pack()
+        playback_buttons_frame = tk.Frame(controls_inner, bg=self.theme["card"]);
+        playback_buttons_frame.pack(pady=10)
+        self.step_back_btn, self.pause_play_btn, self.step_fwd_btn = self.create_playback_button(playback_buttons_frame,
+                                                                                                 "⏪",
+                                                                                                 self.step_backward), self.create_playback_button(
+            playback_buttons_frame, "⏸", self.toggle_pause_play), self.create_playback_button(playback_buttons_frame,
+                                                                                               "⏩", self.step_forward)
+        self.step_back_btn.pack(side='left', padx=10);
+        self.pause_play_btn.pack(side='left', padx=10);
+        self.step_fwd_btn.pack(side='left', padx=10)
+        speed_frame = tk.Frame(controls_inner, bg=self.theme["card"]);
+        speed_frame.pack(fill='x', pady=(5, 0))
+        tk.Label(speed_frame, text="Fast", font=self.fonts["text"], bg=self.theme["card"],
+                 fg=self.theme["text_medium"]).pack(side='left', padx=(5, 0))
+        tk.Label(speed_frame, text="Slow", font=self.fonts["text"], bg=self.theme["card"],
+                 fg=self.theme["text_medium"]).pack(side='right', padx=(0, 5))
+        style = ttk.Style();
+        style.configure("TScale", background=self.theme["card"], troughcolor=self.theme["card_border"])
+        ttk.Scale(speed_frame, from_=50, to=1000, orient='horizontal', variable=self.animation_speed).pack(side='left',
+                                                                                                           fill='x',
+                                                                                                           expand=True,
+                                                                                                           padx=5)
+
+    def create_card(self, parent, **kwargs):
+        return tk.Frame(parent, bg=self.theme["card"], highlightbackground=self.theme["card_border"],
+                        highlightthickness=1, **kwargs)
+
+    def create_stat_row(self, parent, label, value, color):
+        frame = tk.Frame(parent, bg=self.theme["card"]);
+        frame.pack(fill='x', padx=30, pady=8)
+        tk.Label(frame, text=label, font=self.fonts["stat_label"], bg=self.theme["card"], fg=self.theme["text_medium"],
+                 anchor='w').pack(side='left')
+        val_widget = tk.Label(frame, text=value, font=self.fonts["stat_value"], bg=self.theme["card"], fg=color,
+                              anchor='e');
+        val_widget.pack(side='right');
+        return val_widget
+
+    @property
+    def size(self):
+        return len(self.goal_state)
+
+    def _tile_font(self):
+        return ("Segoe UI", {3: 38, 4: 28, 5: 22}[self.size], "bold")
+
+    def change_board_size(self):
+        size = int(self.board_size.get().split('x')[0])
+        if self.is_solving or size == self.size:
+            self.board_size.set(f"{self.size}x{self.size}")
+            return
+        self.goal_state = default_goal(size)
+        self.hints.set_goal(self.goal_state)
+        self.title_label.config(text=f"{size * size - 1}-PUZZLE SOLVER")
+        self.root.title(f"{size * size - 1}-Puzzle Solver AI")
+        self.create_input_grid()
+        self.create_display_grid()
+        self.reset_board()
+
+    def create_input_grid(self):
+        for widget in self.input_frame.winfo_children(): widget.destroy()
+        self.input_tiles = {}
+        pad_x, pad_y = {3: (30, 22), 4: (20, 14), 5: (12, 8)}[self.size]
+        for r in range(self.size):
+            for c in range(self.size):
+                frame = tk.Frame(self.input_frame, bg=self.theme["card"], highlightbackground=self.theme["card_border"],
+                                 highlightthickness=2);
+                frame.grid(row=r, column=c, padx=8, pady=8)
+                tile = tk.Entry(frame, width=2, font=self._tile_font(), justify='center', bd=0, relief='flat',
+                                bg=self.theme["tile"], fg=self.theme["tile_text"],
+                                insertbackground=self.theme["primary"]);
+                tile.pack(padx=pad_x, pady=pad_y)
+                tile.bind('<KeyRelease>', lambda e: self.update_difficulty())
+                tile.bind('<FocusIn>', lambda e, f=frame: f.config(highlightbackground=self.theme["primary"]));
+                tile.bind('<FocusOut>', lambda e, f=frame: f.config(highlightbackground=self.theme["card_border"]))
+                self.input_tiles[(r, c)] = tile
+
+    def create_display_grid(self):
+        """Playback board: one canvas with a rectangle and a text item per tile, plus the scrub bar."""
+        for widget in self.display_frame.winfo_children(): widget.destroy()
+        side = BOARD_CELL_PX[self.size] * self.size + BOARD_GAP
+        self.board_canvas = tk.Canvas(self.display_frame, width=side, height=side, bg=self.theme["card"],
+                                      highlightthickness=0)
+        self.board_canvas.pack()
+        self.display_tiles, self.highlighted_tile = {}, None
+        for tile in range(1, self.size ** 2):
+            self.display_tiles[tile] = (
+                self.board_canvas.create_rectangle(0, 0, 0, 0, fill=self.theme["tile"],
+                                                   outline=self.theme["card_border"], width=2),
+                self.board_canvas.create_text(0, 0, text=str(tile), font=self._tile_font(),
+                                              fill=self.theme["tile_text"]))
+        self.step_var = tk.IntVar(value=0)
+        self.scrub_bar = ttk.Scale(self.display_frame, from_=0, to=1, orient='horizontal', variable=self.step_var,
+                                   command=self._on_scrub)
+        self.scrub_bar.pack(fill='x', pady=(12, 0))
+
+    def get_board_state_from_entries(self, entry_widgets):
+        state, flat_list = [], []
+        size = round(len(entry_widgets) ** 0.5)
+        try:
+            for r in range(size):
+                row = []
+                for c in range(size):
+                    val_str = entry_widgets[(r, c)].get()
+                    val = int(val_str if val_str else '0')
+                    if val in flat_list: return None  # Duplicate check
+                    row.append(val);
+                    flat_list.append(val)
+                state.append(row)
+            return state if sorted(flat_list) == list(range(size * size)) else None
+        except ValueError:
+            return None
+
+    def update_difficulty(self, *args):
+        if self.hint_job: self.root.after_cancel(self.hint_job)
+        self.hint_job = None
+        state = self.get_board_state_from_entries(self.input_tiles)
+        if state:
+            # The true number of moves once the hint search has labelled the board; until then the Manhattan
+            # estimate (~). This runs on every key press, so it never starts the forward search; Hint does.
+            hint = self.hints.hint(state, forward=False)
+            if hint:
+                diff, shown = hint[0], str(hint[0])
+            else:
+                diff = calculate_manhattan_distance(state, get_goal_positions(self.goal_state))
+                shown = f"~{diff}"
+                if not self.hints.progress()[2] and is_solvable(state, self.goal_state):
+                    self.hint_job = self.root.after(HINT_RECHECK_MS, self.update_difficulty)
+            if diff == 0:
+                label, color = "Solved", self.theme["success"]
+            elif diff < 10:
+                label, color = f"{shown} - Easy", self.theme["success"]
+            elif diff < 20:
+                label, color = f"{shown} - Medium", self.theme["warning"]
+            else:
+                label, color = f"{shown} - Hard", self.theme["danger"]
+            self.difficulty_label.config(text=label, fg=color)
+        else:
+            self.difficulty_label.config(text="--", fg=self.theme["text_medium"])
+
+    def update_stats_display(self):
+        stats = self.history.get_stats()
+        if stats:
+            self.total_label.config(text=str(stats['total'])); self.avg_moves_label.config(
+                text=f"{stats['avg_moves']:.1f}"); self.best_time_label.config(text=f"{stats['best_time']:.2f}s")
+        else:
+            self.total_label.config(text="0"); self.avg_moves_label.config(text="--"); self.best_time_label.config(
+                text="--")
+        cache = self.cache.stats()
+        self.cache_label.config(text=f"{cache['hits']}/{cache['hits'] + cache['misses']}")
+        self.cache_detail_label.config(text=f"hits/lookups · {cache['misses']} misses · {cache['evictions']} evicted")
+
+    def generate_random(self):
+        self.reset_board()
+        # 3x3 boards are drawn uniformly from every solvable board; bigger ones stay a short walk from the goal
+        # so that they remain solvable in reasonable time.
+        puzzle = random_solvable_state(self.goal_state) if self.size == 3 else generate_random_puzzle(
+            random.randint(20, 60), goal_state=self.goal_state)
+        for r in range(self.size):
+            for c in range(self.size):
+                val = puzzle[r][c];
+                self.input_tiles[(r, c)].delete(0, tk.END);
+                self.input_tiles[(r, c)].insert(0, str(val) if val != 0 else "")
+        self.update_difficulty()
+
+    def reset_board(self):
+        if self.cancel_token: self.cancel_token.cancel()  # stop a search still running in the background
+        if self.animation_job: self.root.after_cancel(self.animation_job)
+        self.cancel_token, self.animation_job = None, None
+        self.solution_path = None
+        self.display_frame.pack_forget();
+        self.input_frame.pack()
+        for tile in self.input_tiles.values(): tile.delete(0, tk.END)
+        self.moves_label.config(text="0");
+        self.time_label.config(text="0.00s");
+        self.nodes_label.config(text="0")
+        self.heuristic_label.config(text="")
+        self.is_solving, self.is_paused = False, False;
+        self.update_difficulty()
+        self.set_playback_buttons_state('disabled');
+        self.pause_play_btn.config(text="⏸")
+
+    def solve_puzzle_threaded(self):
+        if self.is_solving or self.solution_path: return
+        initial_state = self.get_board_state_from_entries(self.input_tiles)
+        if not initial_state: messagebox.showerror("Invalid Puzzle",
+                                                   f"Please enter a valid puzzle (numbers 0-{self.size ** 2 - 1}, "
+                                                   "no duplicates)."); return
+        if not is_solvable(initial_state, self.goal_state): messagebox.showerror(
+            "Unsolvable Puzzle", "This puzzle configuration is not solvable for the current goal state."); return
+        self.is_solving, self.current_puzzle = True, initial_state
+        goal_pos = get_goal_positions(self.goal_state)
+        difficulty = calculate_manhattan_distance(initial_state, goal_pos)
+        algorithm = self.algorithm.get()
+        heuristic = FIXED_HEURISTICS.get(algorithm, self.heuristic.get())
+        self.cancel_token, telemetry = CancelToken(), SearchTelemetry()
+        threading.Thread(target=self._run_solver, args=(initial_state, difficulty, algorithm, heuristic,
+                                                        self.cancel_token, TIME_LIMITS[self.time_limit.get()],
+                                                        telemetry), daemon=True).start()
+        self._poll_telemetry(self.cancel_token, telemetry, algorithm != 'anytime')
+
+    def _run_solver(self, initial_state, difficulty, algorithm, heuristic, token, time_limit=None, telemetry=None):
+        start_time = time.time()
+        # The solver thread never touches Tk for progress: it publishes throttled telemetry snapshots
+        # that _poll_telemetry reads on the main thread.
+        options = {}
+        if algorithm == 'anytime':  # play each improving path as soon as it is found
+            options['on_solution'] = lambda path, n, proven: self.root.after(
+                0, self._show_improvement, token, path, n, time.time() - start_time, proven)
+        hits = self.cache.hits
+        try:
+            if self.service and algorithm != 'anytime':  # the service only returns final paths
+                path, nodes = request_solve(self.service, initial_state, self.goal_state, cancel=token,
+                                            algorithm=algorithm, heuristic=heuristic, time_limit=time_limit)
+            else:
+                path, nodes = self.cache.solve(initial_state, self.goal_state, algorithm=algorithm,
+                                               heuristic=heuristic or 'manhattan', cancel=token,
+                                               time_limit=time_limit, telemetry=telemetry, **options)
+        except SearchAborted as e:
+            if e.reason != 'cancelled':
+                self.root.after(0, self._solver_failed, f"{e}. Try a longer time limit or another algorithm.", token)
+            return
+        except ValueError as e:  # e.g. a mode that does not support this board size
+            self.root.after(0, self._solver_failed, str(e), token)
+            return
+        except OSError as e:
+            self.root.after(0, self._solver_failed, f"Solve service at {self.service} is unavailable: {e}", token)
+            return
+        solve_time = time.time() - start_time
+        cached = self.cache.hits > hits  # a replayed path is not a new solve, so it stays out of the history
+        self.root.after(0, self._solver_finished, token, path, nodes, solve_time, difficulty, heuristic, cached,
+                        algorithm)
+
+    def _solver_failed(self, message, token=None):
+        if token is not self.cancel_token: return
+        self.is_solving, self.cancel_token = False, None
+        messagebox.showerror("Error", message)
+
+    def _solver_finished(self, token, path, nodes, solve_time, difficulty, heuristic, cached=False, algorithm=None):
+        if token is not self.cancel_token: return  # the board was reset while the search ran
+        self.cancel_token = None
+        self.start_animation(path, nodes, solve_time, difficulty, heuristic, record=not cached, algorithm=algorithm)
+        if cached: self.heuristic_label.config(text="from cache")
+
+    def _show_improvement(self, token, path, nodes, solve_time, proven):
+        """Plays a better anytime solution straight away; history is recorded once the search finishes."""
+        if token is not self.cancel_token: return
+        self.start_animation(path, nodes, solve_time, None, record=False)
+        self.heuristic_label.config(text="proven optimal" if proven else "improving...")
+
+    def _poll_telemetry(self, token, telemetry, caption=True):
+        """Shows the latest telemetry snapshot every TELEMETRY_INTERVAL while this solve is still running."""
+        if token is not self.cancel_token: return
+        snapshot = telemetry.snapshot
+        if snapshot:
+            self.nodes_label.config(text=str(snapshot['expanded']))
+            self.time_label.config(text=f"{snapshot['elapsed']:.2f}s")
+            if caption:
+                self.heuristic_label.config(text=f"{snapshot['nodes_per_sec'] / 1000:.0f}k nodes/s · "
+                                                 f"open {snapshot['open']} · depth {snapshot['max_depth']}")
+        self.root.after(int(TELEMETRY_INTERVAL * 1000), self._poll_telemetry, token, telemetry, caption)
+
+    def start_animation(self, path, nodes, solve_time, difficulty, heuristic=None, record=True, algorithm=None):
+        if path is None: self.is_solving = False; messagebox.showerror("Error", "No solution found."); return
+        moves = len(path) - 1
+        self.moves_label.config(text=str(moves));
+        self.time_label.config(text=f"{solve_time:.2f}s");
+        self.nodes_label.config(text=str(nodes))
+        self.heuristic_label.config(text=f"nodes via {heuristic}" if heuristic else
+                                    "table lookups" if algorithm == 'table' else "blind search")
+        if record:
+            self.history.add_solve(moves, solve_time, nodes, difficulty, heuristic)
+            self.update_stats_display()
+        if path is self.solution_path: return  # already playing (an anytime improvement shown earlier)
+        self._cancel_animation_job()
+        self.solution_path, self.solution_moves, self.current_step = path, tile_moves(path), 0
+        self.is_solving = True
+        self.input_frame.pack_forget();
+        self.display_frame.pack()
+        self.scrub_bar.config(to=max(1, moves))
+        self.set_playback_buttons_state('normal');
+        self.is_paused = False;
+        self.pause_play_btn.config(text="⏸")
+        self._draw_current_step()
+        self.animation_job = self.root.after(self.animation_speed.get(), self.animate_next_step)
+
+    # --- Playback: tiles are canvas items; a step moves one tile and recolours at most two ---
+    def _cell_origin(self, cell):
+        return (BOARD_GAP + (cell % self.size) * BOARD_CELL_PX[self.size],
+                BOARD_GAP + (cell // self.size) * BOARD_CELL_PX[self.size])
+
+    def _place_tile(self, tile, x, y):
+        rect, text = self.display_tiles[tile]
+        side = BOARD_CELL_PX[self.size] - BOARD_GAP
+        self.board_canvas.coords(rect, x, y, x + side, y + side)
+        self.board_canvas.coords(text, x + side / 2, y + side / 2)
+
+    def _color_tile(self, tile, role=None):
+        rect, _ = self.display_tiles[tile]
+        self.board_canvas.itemconfig(rect, fill=self.theme[role or "tile"], outline=self.theme[role or "card_border"])
+
+    def _cancel_animation_job(self):
+        if self.animation_job: self.root.after_cancel(self.animation_job); self.animation_job = None
+
+    def _draw_current_step(self):
+        """Lays out the whole board for current_step; used to seek, everything else moves single tiles."""
+        if not self.solution_path: return
+        self.sliding = False
+        is_final = self.current_step == len(self.solution_moves)
+        moved = self.solution_moves[self.current_step - 1][0] if self.current_step else None
+        for cell, tile in enumerate(t for row in self.solution_path[self.current_step] for t in row):
+            if tile:
+                self._place_tile(tile, *self._cell_origin(cell))
+                self._color_tile(tile, "success" if is_final else "primary" if tile == moved else None)
+        self.highlighted_tile = moved
+        self._step_changed()
+
+    def _land(self, step, tile):
+        """Makes `step` current once `tile` sits in its cell, recolouring only the tiles whose highlight changes."""
+        self.current_step = step
+        if step == len(self.solution_moves):
+            for other in self.display_tiles: self._color_tile(other, "success")
+        else:
+            if self.highlighted_tile: self._color_tile(self.highlighted_tile)
+            if step: self._color_tile(tile, "primary")
+        self.highlighted_tile = tile if step else None
+        self._step_changed()
+
+    def _step_changed(self):
+        self.step_var.set(self.current_step)
+        self.step_back_btn.config(state='normal' if self.current_step > 0 else 'disabled')
+        self.step_fwd_btn.config(state='normal' if self.current_step < len(self.solution_moves) else 'disabled')
+
+    def animate_next_step(self):
+        self.animation_job = None
+        if self.is_paused or not self.is_solving: return
+        if self.current_step < len(self.solution_moves):
+            duration = self.animation_speed.get() * SLIDE_FRACTION
+            self._slide(self.current_step, time.perf_counter(), duration)
+        else:
+            self.is_solving, self.is_paused = False, True
+            self.pause_play_btn.config(state='disabled', text="▶")
+
+    def _slide(self, step, started, duration):
+        """One animation frame; progress comes from the clock, so slow frames do not slow the playback down."""
+        tile, src, dst = self.solution_moves[step]
+        self.sliding = True
+        progress = min(1.0, (time.perf_counter() - started) * 1000 / duration) if duration > 0 else 1.0
+        (x0, y0), (x1, y1) = self._cell_origin(src), self._cell_origin(dst)
+        self._place_tile(tile, x0 + (x1 - x0) * progress, y0 + (y1 - y0) * progress)
+        if progress < 1.0:
+            self.animation_job = self.root.after(FRAME_MS, self._slide, step, started, duration)
+            return
+        self.sliding = False
+        self._land(step + 1, tile)
+        self.animation_job = self.root.after(max(1, int(self.animation_speed.get() - duration)),
+                                             self.animate_next_step)
+
+    def set_playback_buttons_state(self, state):
+        self.step_back_btn.config(state=state);
+        self.pause_play_btn.config(state=state);
+        self.step_fwd_btn.config(state=state)
+
+    def _pause_playback(self):
+        """Stops playback where it is; a half-finished slide snaps back to the current step."""
+        self._cancel_animation_job()
+        if self.sliding: self._draw_current_step()
+        if self.is_solving:
+            self.is_paused = True
+            self.pause_play_btn.config(text="▶")
+
+    def toggle_pause_play(self):
+        if not self.is_solving: return
+        if not self.is_paused:
+            self._pause_playback()
+        else:
+            self.is_paused = False
+            self.pause_play_btn.config(text="⏸"); self.animate_next_step()
+
+    def step_forward(self):
+        if self.solution_path and self.current_step < len(self.solution_moves):
+            self._pause_playback()
+            tile, _, dst = self.solution_moves[self.current_step]
+            self._place_tile(tile, *self._cell_origin(dst))
+            self._land(self.current_step + 1, tile)
+
+    def step_backward(self):
+        if self.solution_path and self.current_step > 0:
+            self._pause_playback()
+            if self.current_step == len(self.solution_moves):  # leaving the all-green final board
+                self.current_step -= 1
+                self._draw_current_step()
+                return
+            tile, src, _ = self.solution_moves[self.current_step - 1]
+            self._place_tile(tile, *self._cell_origin(src))
+            self._land(self.current_step - 1, self.solution_moves[self.current_step - 2][0] if self.current_step > 1
+                       else None)
+
+    def _on_scrub(self, value):
+        step = int(float(value))
+        if not self.solution_path or step == self.current_step: return
+        playing = self.is_solving and not self.is_paused
+        self._cancel_animation_job()
+        self.current_step = step
+        self._draw_current_step()
+        if playing: self.animation_job = self.root.after(self.animation_speed.get(), self.animate_next_step)
+
+    def open_goal_state_editor(self):
+        editor = tk.Toplevel(self.root);
+        editor.title("Set Custom Goal State");
+        editor.config(bg=self.theme["card"])
+        editor.transient(self.root);
+        editor.grab_set()
+        entries = {}
+        for r in range(self.size):
+            for c in range(self.size):
+                frame = tk.Frame(editor, bg=self.theme["card"], highlightbackground=self.theme["card_border"],
+                                 highlightthickness=1);
+                frame.grid(row=r, column=c, padx=5, pady=5)
+                entry = tk.Entry(frame, width=2, font=self._tile_font(), justify='center', bd=0, relief='flat',
+                                 bg=self.theme["tile"], fg=self.theme["tile_text"]);
+                entry.pack(padx=15, pady=10)
+                val = self.goal_state[r][c];
+                entry.insert(0, str(val) if val != 0 else "")
+                entries[(r, c)] = entry
+        btn_frame = tk.Frame(editor, bg=self.theme["card"]);
+        btn_frame.grid(row=self.size, column=0, columnspan=self.size, pady=10)
+
+        def save():
+            new_goal = self.get_board_state_from_entries(entries)
+            if new_goal:
+                self.goal_state = new_goal; self.hints.set_goal(new_goal); self.update_difficulty(); editor.destroy()
+            else:
+                messagebox.showerror("Invalid Goal", "Please enter a valid puzzle configuration "
+                                                     f"(0-{self.size ** 2 - 1}, no duplicates).", parent=editor)
+
+        tk.Button(btn_frame, text="Save", command=save, bg=self.theme["success"], fg="#ffffff", bd=0,
+                  font=("Segoe UI", 10, "bold"), padx=10, pady=5).pack(side='left', padx=10)
+        tk.Button(btn_frame, text="Cancel", command=editor.destroy, bg=self.theme["danger"], fg="#ffffff", bd=0,
+                  font=("Segoe UI", 10, "bold"), padx=10, pady=5).pack(side='left', padx=10)
+
+    def create_playback_button(self, parent, text, command):
+        return tk.Button(parent, text=text, font=("Segoe UI", 14), bd=0, bg=self.theme["card"],
+                         fg=self.theme["text_light"], activebackground=self.theme["card_border"],
+                         activeforeground=self.theme["text_light"], relief='flat', command=command, state='disabled')
+
+    def show_hint(self):
+        state = self.get_board_state_from_entries(self.input_tiles)
+        if not state:
+            messagebox.showerror("Hint", f"Enter a complete board first (numbers 0-{self.size ** 2 - 1})."); return
+        if not is_solvable(state, self.goal_state):
+            messagebox.showerror("Hint", "This board cannot reach the current goal state."); return
+        hint = self.hints.hint(state)
+        if hint is None:
+            messagebox.showinfo("Hint", "This board is too far from the goal for an instant hint yet. "
+                                        "Try again in a moment, or solve it."); return
+        distance, next_state = hint
+        if next_state is None:
+            messagebox.showinfo("Hint", "Already solved!"); return
+        (tile, src, dst), = tile_moves([state, next_state])
+        direction = {-self.size: "up", self.size: "down", -1: "left", 1: "right"}[dst - src]
+        messagebox.showinfo("Hint", f"Move tile {tile} {direction}.\n{distance} moves to go with best play.")
+
+    def export_history(self):
+        filename = filedialog.asksaveasfilename(title="Export History", defaultextension=".csv",
+                                                filetypes=[("CSV", "*.csv"), ("JSON", "*.json")])
+        if not filename: return
+        fmt = 'json' if filename.lower().endswith('.json') else 'csv'
+        try:
+            with open(filename, 'w', newline='', encoding='utf-8') as f:
+                count = self.history.export(f, fmt)
+        except IOError as e:
+            messagebox.showerror("Export", f"Could not export history: {e}"); return
+        messagebox.showinfo("Export", f"Exported {count} solves to {os.path.basename(filename)}.")
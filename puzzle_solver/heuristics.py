@@ -0,0 +1,299 @@
+"""Admissible heuristics over packed states, built once per goal and shared between searches."""
+import threading
+from collections import OrderedDict, deque
+
+from .board import get_goal_positions, board_geometry, encode_state, _manhattan_table, _packed_manhattan
+
+
+# --- Heuristics ---
+# Every heuristic is built once per goal and scores packed states. evaluate() scores a state from scratch;
+# update() scores a child from its parent's value after `tile` slid from cell `src` into the blank at `dst`.
+
+class ManhattanHeuristic:
+    """Sum of tile distances, updated incrementally as a one-tile delta."""
+    name = 'manhattan'
+
+    def __init__(self, goal_state):
+        self.bits = board_geometry(len(goal_state))[0]
+        self.table = _manhattan_table(goal_state)
+
+    def evaluate(self, code):
+        return _packed_manhattan(code, self.table, self.bits)
+
+    def update(self, value, new_code, tile, src, dst):
+        distances = self.table[tile]
+        return value + distances[dst] - distances[src]
+
+
+LINE_MEMO_LIMIT = 1 << 16  # memoised values per row or column; 4x4 lines have 43,680 tile arrangements
+
+
+def _line_conflicts(tiles, goal_lines, goal_offsets, line):
+    """Number of tiles to pull out of a row/column so the rest of its goal tiles are in order."""
+    offsets = [goal_offsets[t] for t in tiles if t and goal_lines[t] == line]
+    longest = [1] * len(offsets)
+    for i in range(len(offsets)):
+        for j in range(i):
+            if offsets[j] < offsets[i]:
+                longest[i] = max(longest[i], longest[j] + 1)
+    return len(offsets) - max(longest, default=0)
+
+
+class LinearConflictHeuristic:
+    """Manhattan distance plus two moves for every tile that must leave its goal row/column to let another pass.
+
+    Conflicts for a row or column only depend on the tiles in it, so they are memoised per packed line value
+    and a state is scored with one lookup per row and column on top of Manhattan. A line's memo is cleared
+    once it holds LINE_MEMO_LIMIT values, which only happens on 5x5 boards.
+    """
+    name = 'linear_conflict'
+
+    def __init__(self, goal_state):
+        self.size = size = len(goal_state)
+        self.bits, self.mask, _ = board_geometry(size)
+        self.row_bits = size * self.bits
+        self.row_mask = (1 << self.row_bits) - 1
+        self.manhattan = ManhattanHeuristic(goal_state)
+        goal_positions = get_goal_positions(goal_state)
+        self.goal_rows = [goal_positions[t][0] for t in range(size * size)]
+        self.goal_cols = [goal_positions[t][1] for t in range(size * size)]
+        self.row_conflicts = [{} for _ in range(size)]
+        self.col_conflicts = [{} for _ in range(size)]
+
+    def _tiles(self, key):
+        return [(key >> (i * self.bits)) & self.mask for i in range(self.size)]
+
+    def _row(self, code, row):
+        key = (code >> (row * self.row_bits)) & self.row_mask
+        conflicts = self.row_conflicts[row].get(key)
+        if conflicts is None:
+            conflicts = 2 * _line_conflicts(self._tiles(key), self.goal_rows, self.goal_cols, row)
+            self._memoise(self.row_conflicts[row], key, conflicts)
+        return conflicts
+
+    def _column(self, code, column):
+        size, bits, mask = self.size, self.bits, self.mask
+        key = 0
+        for i in range(size):
+            key |= ((code >> ((i * size + column) * bits)) & mask) << (i * bits)
+        conflicts = self.col_conflicts[column].get(key)
+        if conflicts is None:
+            conflicts = 2 * _line_conflicts(self._tiles(key), self.goal_cols, self.goal_rows, column)
+            self._memoise(self.col_conflicts[column], key, conflicts)
+        return conflicts
+
+    @staticmethod
+    def _memoise(memo, key, conflicts):
+        if len(memo) >= LINE_MEMO_LIMIT:
+            memo.clear()
+        memo[key] = conflicts
+
+    def evaluate(self, code):
+        return self.manhattan.evaluate(code) + sum(self._row(code, line) + self._column(code, line)
+                                                   for line in range(self.size))
+
+    def update(self, value, new_code, tile, src, dst):
+        # Manhattan moves by the usual one-tile delta; only the rows and columns holding src or dst can gain or
+        # lose conflicts, so just those lines are re-read before and after the move.
+        distances = self.manhattan.table[tile]
+        old_code = new_code + (tile << (src * self.bits)) - (tile << (dst * self.bits))
+        src_row, src_col = divmod(src, self.size)
+        dst_row, dst_col = divmod(dst, self.size)
+        value += distances[dst] - distances[src]
+        for row in ((src_row,) if src_row == dst_row else (src_row, dst_row)):
+            value += self._row(new_code, row) - self._row(old_code, row)
+        for column in ((src_col,) if src_col == dst_col else (src_col, dst_col)):
+            value += self._column(new_code, column) - self._column(old_code, column)
+        return value
+
+
+def _walking_distance_table(goal_lines, blank_line, size):
+    """BFS over (tiles-per-line-by-goal-line counts, blank line) from the goal, as in Takahashi's walking distance.
+
+    A key packs count[line][goal_line] into size.bit_length() bits each and the blank's line above that.
+    """
+    count_bits = size.bit_length()
+    goal_counts = [[0] * size for _ in range(size)]
+    for tile in range(1, size * size):
+        goal_counts[goal_lines[tile]][goal_lines[tile]] += 1
+
+    def pack(counts, blank):
+        key = blank << (count_bits * size * size)
+        for line in range(size):
+            for goal_line in range(size):
+                key |= counts[line][goal_line] << (count_bits * (line * size + goal_line))
+        return key
+
+    start = pack(goal_counts, blank_line)
+    distances = {start: 0}
+    frontier = [(goal_counts, blank_line)]
+    while frontier:
+        next_frontier = []
+        for counts, blank in frontier:
+            depth = distances[pack(counts, blank)] + 1
+            for line in (blank - 1, blank + 1):
+                if 0 <= line < size:
+                    for goal_line in range(size):
+                        if counts[line][goal_line]:
+                            moved = [row[:] for row in counts]
+                            moved[line][goal_line] -= 1
+                            moved[blank][goal_line] += 1
+                            key = pack(moved, line)
+                            if key not in distances:
+                                distances[key] = depth
+                                next_frontier.append((moved, line))
+        frontier = next_frontier
+    return distances
+
+
+class WalkingDistanceHeuristic:
+    """Vertical plus horizontal walking distance; dominates Manhattan and accounts for tiles blocking a line.
+    5x5 boards are not supported because their tables would not fit in memory."""
+    name = 'walking_distance'
+
+    def __init__(self, goal_state):
+        size = len(goal_state)
+        if size > 4:
+            raise ValueError("Walking distance is only available for 3x3 and 4x4 boards")
+        self.bits, self.mask, _ = board_geometry(size)
+        count_bits = size.bit_length()
+        goal_positions = get_goal_positions(goal_state)
+        self.tables, self.weights = [], []
+        for axis in range(2):  # 0: rows, 1: columns
+            goal_lines = [goal_positions[t][axis] for t in range(size * size)]
+            self.tables.append(_walking_distance_table(goal_lines, goal_positions[0][axis], size))
+            weights = [[0] * (size * size) for _ in range(size * size)]
+            for cell in range(size * size):
+                line = (cell // size, cell % size)[axis]
+                weights[0][cell] = line << (count_bits * size * size)
+                for tile in range(1, size * size):
+                    weights[tile][cell] = 1 << (count_bits * (line * size + goal_lines[tile]))
+            self.weights.append(weights)
+
+    def evaluate(self, code):
+        bits, mask = self.bits, self.mask
+        total = 0
+        for table, weights in zip(self.tables, self.weights):
+            key = 0
+            for cell in range(len(weights)):
+                key += weights[(code >> (cell * bits)) & mask][cell]
+            total += table[key]
+        return total
+
+    def update(self, value, new_code, tile, src, dst):
+        return self.evaluate(new_code)
+
+
+def _pattern_database(goal_flat, pattern, size):
+    """0-1 BFS over (pattern tile cells, blank cell) counting only pattern-tile moves; min over blank cells.
+
+    Returns a bytearray indexed by the packed pattern cells (one cell-width field per pattern tile).
+    """
+    bits, mask, neighbors = board_geometry(size)
+    blank_shift = len(pattern) * bits
+    start = goal_flat.index(0) << blank_shift
+    for i, tile in enumerate(pattern):
+        start |= goal_flat.index(tile) << (i * bits)
+    distances = bytearray([0xFF]) * (1 << (blank_shift + bits))
+    distances[start] = 0
+    queue = deque([start])
+    while queue:
+        key = queue.popleft()
+        depth = distances[key]
+        blank = key >> blank_shift
+        cells = [(key >> (i * bits)) & mask for i in range(len(pattern))]
+        for cell in neighbors[blank]:
+            if cell in cells:
+                i = cells.index(cell)
+                child = key - (cell << (i * bits)) + (blank << (i * bits)) + ((cell - blank) << blank_shift)
+                cost = 1
+            else:
+                child, cost = key + ((cell - blank) << blank_shift), 0
+            if depth + cost < distances[child]:
+                distances[child] = depth + cost
+                if cost:
+                    queue.append(child)
+                else:
+                    queue.appendleft(child)
+    database = bytearray([0xFF]) * (1 << blank_shift)
+    for blank in range(size * size):
+        offset = blank << blank_shift
+        for key in range(1 << blank_shift):
+            depth = distances[offset + key]
+            if depth < database[key]:
+                database[key] = depth
+    return database
+
+
+class PatternDatabaseHeuristic:
+    """Additive disjoint pattern databases: tiles in goal reading order, four per group (4+4 on 3x3, 4+4+4+3 on
+    4x4). 5x5 boards are not supported because their databases would not fit in memory."""
+    name = 'pattern_database'
+
+    def __init__(self, goal_state):
+        size = len(goal_state)
+        if size > 4:
+            raise ValueError("Pattern databases are only available for 3x3 and 4x4 boards")
+        self.bits, self.mask, _ = board_geometry(size)
+        goal_flat = [tile for row in goal_state for tile in row]
+        tiles = [t for t in goal_flat if t]
+        self.patterns = [tiles[i:i + 4] for i in range(0, len(tiles), 4)]
+        self.databases = [_pattern_database(goal_flat, pattern, size) for pattern in self.patterns]
+        # shifts[tile] = (which database, bit offset of the tile's cell inside that database's key)
+        self.shifts = [None] * (size * size)
+        for index, pattern in enumerate(self.patterns):
+            for i, tile in enumerate(pattern):
+                self.shifts[tile] = (index, i * self.bits)
+
+    def evaluate(self, code):
+        keys = [0] * len(self.patterns)
+        for cell in range(len(self.shifts)):
+            tile = (code >> (cell * self.bits)) & self.mask
+            if tile:
+                index, shift = self.shifts[tile]
+                keys[index] |= cell << shift
+        return sum(database[key] for database, key in zip(self.databases, keys))
+
+    def update(self, value, new_code, tile, src, dst):
+        # Only the moved tile's database changes, so it is the only one looked up. Its key still needs the cells
+        # of the pattern's other tiles, which means a scan of the board, so this is not much cheaper than
+        # evaluate(): roughly a third less on 4x4.
+        index, shift = self.shifts[tile]
+        database = self.databases[index]
+        new_key = self._key(new_code, index)
+        old_key = new_key - (dst << shift) + (src << shift)
+        return value - database[old_key] + database[new_key]
+
+    def _key(self, code, index):
+        key = 0
+        for cell in range(len(self.shifts)):
+            tile = (code >> (cell * self.bits)) & self.mask
+            if tile and self.shifts[tile][0] == index:
+                key |= cell << self.shifts[tile][1]
+        return key
+
+
+HEURISTICS = {h.name: h for h in (ManhattanHeuristic, LinearConflictHeuristic, WalkingDistanceHeuristic,
+                                  PatternDatabaseHeuristic)}
+HEURISTIC_CACHE_SIZE = 8  # built heuristics kept; the least recently used is dropped first
+_heuristic_cache = OrderedDict()
+_heuristic_cache_lock = threading.Lock()
+
+
+def get_heuristic(name, goal_state):
+    """Returns the named heuristic built against goal_state, reusing tables built for the same goal.
+
+    Only the HEURISTIC_CACHE_SIZE most recently used ones are kept, so a long-lived process that sees many
+    goals does not hold a set of tables for each of them.
+    """
+    if name not in HEURISTICS:
+        raise ValueError(f"Unknown heuristic {name!r}; expected one of {', '.join(HEURISTICS)}")
+    key = (name, len(goal_state), encode_state(goal_state))
+    with _heuristic_cache_lock:
+        if key in _heuristic_cache:
+            _heuristic_cache.move_to_end(key)
+        else:
+            _heuristic_cache[key] = HEURISTICS[name](goal_state)
+            while len(_heuristic_cache) > HEURISTIC_CACHE_SIZE:
+                _heuristic_cache.popitem(last=False)
+        return _heuristic_cache[key]
@@ -0,0 +1,132 @@
+"""Instant hints from a breadth-first search rooted at the goal and kept warm in the background."""
+import threading
+
+from .board import board_geometry, encode_state, decode_state, is_solvable
+
+
+# Boards labelled per goal, by board size: all 181,440 of 3x3; bigger boards stop at a radius. About
+# 150 bytes each, so 4x4 and 5x5 hold some 40 MB.
+HINT_MAX_STATES = {3: 200_000, 4: 250_000, 5: 250_000}
+HINT_SEARCH_NODES = 20_000  # forward-search budget for a board the goal search has not reached yet
+
+
+class _GoalSearch:
+    """Distances from one goal, filled in by a background thread one BFS layer at a time."""
+
+    def __init__(self, goal_state):
+        self.goal_state, self.size = [row[:] for row in goal_state], len(goal_state)
+        self.distances = {encode_state(goal_state): 0}
+        self.complete_depth = 0  # every board within this many moves of the goal is in distances
+        self.finished = False
+        self.stop = threading.Event()
+
+
+class HintEngine:
+    """Best next move and remaining distance for any board, answered from a warm reverse search.
+
+    set_goal() starts labelling boards by their distance from the goal on a daemon thread. hint() answers
+    boards already labelled with a dictionary lookup; for the rest it searches forward from the board until it
+    meets the fully labelled layers, which still gives the optimal distance. It returns None when neither can
+    answer yet, so callers should fall back to an estimate. max_states caps the labelled boards per goal
+    (default: HINT_MAX_STATES for the goal's size).
+    """
+
+    def __init__(self, max_states=None, search_nodes=HINT_SEARCH_NODES):
+        self.max_states, self.search_nodes = max_states, search_nodes
+        self._search = None
+
+    def set_goal(self, goal_state):
+        """Restarts the background search for a new goal; does nothing if the goal is unchanged."""
+        if self._search is not None:
+            if self._search.goal_state == goal_state:
+                return
+            self._search.stop.set()
+        self._search = _GoalSearch(goal_state)
+        threading.Thread(target=self._grow, args=(self._search,), daemon=True).start()
+
+    def stop(self):
+        if self._search is not None:
+            self._search.stop.set()
+
+    def progress(self):
+        """(boards labelled, complete depth, finished) for the current goal."""
+        search = self._search
+        return (len(search.distances), search.complete_depth, search.finished) if search else (0, 0, False)
+
+    def _grow(self, search):
+        bits, mask, neighbors = board_geometry(search.size)
+        distances, stop = search.distances, search.stop
+        frontier = [(encode_state(search.goal_state), [t for row in search.goal_state for t in row].index(0))]
+        depth = 0
+        while frontier:
+            depth += 1
+            next_frontier = []
+            for code, blank in frontier:
+                if stop.is_set():
+                    return
+                blank_shift = blank * bits
+                for cell in neighbors[blank]:
+                    shift = cell * bits
+                    tile = (code >> shift) & mask
+                    new_code = code - (tile << shift) + (tile << blank_shift)
+                    if new_code not in distances:
+                        distances[new_code] = depth
+                        next_frontier.append((new_code, cell))
+                if len(distances) >= (self.max_states or HINT_MAX_STATES[search.size]):
+                    search.finished = True  # the layer being built is partial, so complete_depth stays put
+                    return
+            search.complete_depth = depth
+            frontier = next_frontier
+        search.complete_depth, search.finished = depth, True
+
+    def hint(self, state, forward=True):
+        """(moves to the goal, board after the best next move) for state, or None if not known yet.
+
+        The board after the move is None when state is already the goal. Unsolvable boards, and boards of
+        another size than the goal, return None. With forward=False only labelled boards are answered, so the
+        call never runs the forward search (up to HINT_SEARCH_NODES expansions, a tenth of a second on 4x4).
+        """
+        search = self._search
+        if search is None or len(state) != search.size or not is_solvable(state, search.goal_state):
+            return None
+        bits, mask, neighbors = board_geometry(search.size)
+        code, blank = encode_state(state), [t for row in state for t in row].index(0)
+        distance = search.distances.get(code)
+        if distance is not None:
+            # Each labelled board at distance d has a neighbour labelled d - 1: its whole layer is complete.
+            for cell in neighbors[blank]:
+                tile = (code >> cell * bits) & mask
+                new_code = code - (tile << cell * bits) + (tile << blank * bits)
+                if distance and search.distances.get(new_code) == distance - 1:
+                    return distance, decode_state(new_code, search.size)
+            return distance, None
+        return self._search_forward(search, code, blank) if forward else None
+
+    def _search_forward(self, search, start, start_blank):
+        # Every board within `depth` moves of the goal is labelled, so an unlabelled board is further away and
+        # its shortest path enters that ball at a board exactly `depth` moves out. The first labelled board a
+        # forward BFS reaches (after g moves) therefore puts the board g + depth moves from the goal.
+        bits, mask, neighbors = board_geometry(search.size)
+        depth, distances = search.complete_depth, search.distances
+        parents, frontier, g, expanded = {start: None}, [(start, start_blank)], 0, 0
+        while frontier and expanded < self.search_nodes:
+            g += 1
+            next_frontier = []
+            for code, blank in frontier:
+                expanded += 1
+                blank_shift = blank * bits
+                for cell in neighbors[blank]:
+                    shift = cell * bits
+                    tile = (code >> shift) & mask
+                    new_code = code - (tile << shift) + (tile << blank_shift)
+                    if new_code in parents:
+                        continue
+                    parents[new_code] = code
+                    known = distances.get(new_code)
+                    if known is not None and known <= depth:
+                        while parents[new_code] != start:
+                            new_code = parents[new_code]
+                        return g + known, decode_state(new_code, search.size)
+                    next_frontier.append((new_code, cell))
+            frontier = next_frontier
+        return None
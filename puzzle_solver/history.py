@@ -0,0 +1,180 @@
+"""Append-only solve history with running aggregates."""
+import json
+import os
+import csv
+from datetime import datetime
+
+
+# --- History Manager ---
+HISTORY_FIELDS = ('date', 'moves', 'time', 'nodes', 'difficulty', 'heuristic')
+DIFFICULTY_BUCKET = 5  # width (in Manhattan distance) of the per-difficulty stats buckets
+
+
+class HistoryManager:
+    """Append-only JSONL log of every solve, with running aggregates so get_stats never rescans the log.
+
+    The aggregates are checkpointed to a small sidecar file together with the log offset they cover, so start-up
+    only reads the lines appended since. A line torn by a crash is dropped by compacting the log.
+    """
+
+    def __init__(self, filename='puzzle_history.jsonl', checkpoint_every=20):
+        base = os.path.splitext(filename)[0]
+        self.filename, self.stats_filename = filename, base + '.stats.json'
+        self.checkpoint_every, self.pending = checkpoint_every, 0
+        self._import_legacy(base + '.json')
+        self.aggregates = self.load_history()
+
+    @staticmethod
+    def _empty_aggregates():
+        return {'offset': 0, 'count': 0, 'sum_moves': 0, 'sum_time': 0.0, 'sum_nodes': 0, 'best_time': None,
+                'buckets': {}}
+
+    @staticmethod
+    def _accumulate(aggregates, record):
+        aggregates['count'] += 1
+        aggregates['sum_moves'] += record['moves']
+        aggregates['sum_time'] += record['time']
+        aggregates['sum_nodes'] += record.get('nodes') or 0
+        if aggregates['best_time'] is None or record['time'] < aggregates['best_time']:
+            aggregates['best_time'] = record['time']
+        bucket = str((record.get('difficulty') or 0) // DIFFICULTY_BUCKET * DIFFICULTY_BUCKET)
+        count, moves, solve_time = aggregates['buckets'].get(bucket, (0, 0, 0.0))
+        aggregates['buckets'][bucket] = [count + 1, moves + record['moves'], solve_time + record['time']]
+
+    def _import_legacy(self, legacy_filename):
+        """Moves the old capped puzzle_history.json list into the log the first time it is seen."""
+        if os.path.exists(self.filename) or not os.path.exists(legacy_filename):
+            return
+        try:
+            with open(legacy_filename, 'r') as f:
+                records = json.load(f)
+            self._write_log(records)
+        except (json.JSONDecodeError, IOError, TypeError):
+            print("Warning: Could not import old history.")
+
+    def _write_log(self, records):
+        """Atomically replaces the log with the given records."""
+        tmp = f'{self.filename}.{os.getpid()}.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record, separators=(',', ':')) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.filename)
+
+    def load_history(self):
+        """Returns the aggregates, reading only the part of the log the last checkpoint does not cover."""
+        aggregates = self._empty_aggregates()
+        try:
+            with open(self.stats_filename, 'r') as f:
+                aggregates.update(json.load(f))
+        except (json.JSONDecodeError, IOError, ValueError):
+            pass
+        try:
+            size = os.path.getsize(self.filename)
+        except OSError:
+            return self._empty_aggregates()
+        if aggregates['offset'] > size:  # the log was replaced behind our back
+            aggregates = self._empty_aggregates()
+        damaged = False
+        with open(self.filename, 'rb') as f:
+            f.seek(aggregates['offset'])
+            for line in f:
+                try:
+                    if not line.endswith(b'\n'):
+                        raise ValueError('torn line')
+                    self._accumulate(aggregates, json.loads(line))
+                except (ValueError, KeyError, TypeError):
+                    damaged = True
+                aggregates['offset'] += len(line)
+        if damaged:
+            return self.compact()
+        self.aggregates = aggregates
+        if aggregates['offset'] and self.checkpoint_every:
+            self.save_history()
+        return aggregates
+
+    def save_history(self):
+        """Checkpoints the aggregates next to the log (write-then-rename, so a crash leaves the old one)."""
+        tmp = f'{self.stats_filename}.{os.getpid()}.tmp'
+        try:
+            with open(tmp, 'w') as f:
+                json.dump(self.aggregates, f, separators=(',', ':'))
+            os.replace(tmp, self.stats_filename)
+            self.pending = 0
+        except IOError:
+            print("Warning: Could not save history.")
+
+    def compact(self):
+        """Rewrites the log without damaged lines and rebuilds the aggregates from it."""
+        records = list(self.iter_records())
+        self._write_log(records)
+        self.aggregates = self._empty_aggregates()
+        for record in records:
+            self._accumulate(self.aggregates, record)
+        self.aggregates['offset'] = os.path.getsize(self.filename)
+        self.save_history()
+        return self.aggregates
+
+    def add_solve(self, moves, time, nodes, difficulty, heuristic=None):
+        record = {'date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'), 'moves': moves, 'time': round(time, 2),
+                  'nodes': nodes, 'difficulty': difficulty, 'heuristic': heuristic}
+        line = (json.dumps(record, separators=(',', ':')) + '\n').encode('utf-8')
+        try:
+            with open(self.filename, 'ab') as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+        except IOError:
+            print("Warning: Could not save history.")
+            return
+        self.aggregates['offset'] += len(line)
+        self._accumulate(self.aggregates, record)
+        self.pending += 1
+        if self.pending >= self.checkpoint_every:
+            self.save_history()
+
+    def iter_records(self, start=None, end=None):
+        """Streams the logged solves whose date falls in [start, end) (datetimes or 'YYYY-MM-DD ...' strings)."""
+        start, end = (d.strftime('%Y-%m-%d %H:%M:%S') if isinstance(d, datetime) else d for d in (start, end))
+        try:
+            f = open(self.filename, 'r', encoding='utf-8')
+        except IOError:
+            return
+        with f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    date = record['date']
+                except (ValueError, KeyError, TypeError):
+                    continue
+                if (start is None or date >= start) and (end is None or date < end):
+                    yield record
+
+    def export(self, out, fmt='csv', start=None, end=None):
+        """Streams the log (or a date range of it) to an open text file as CSV or a JSON array; returns the count."""
+        count = 0
+        if fmt == 'csv':
+            writer = csv.DictWriter(out, HISTORY_FIELDS, extrasaction='ignore')
+            writer.writeheader()
+            for count, record in enumerate(self.iter_records(start, end), 1):
+                writer.writerow(record)
+        elif fmt == 'json':
+            out.write('[')
+            for count, record in enumerate(self.iter_records(start, end), 1):
+                out.write((',\n ' if count > 1 else '\n ') + json.dumps(record))
+            out.write('\n]\n')
+        else:
+            raise ValueError(f"Unknown export format {fmt!r}; expected 'csv' or 'json'")
+        return count
+
+    def get_stats(self):
+        aggregates = self.aggregates
+        total = aggregates['count']
+        if not total: return None
+        return {'total': total, 'avg_moves': aggregates['sum_moves'] / total,
+                'avg_time': aggregates['sum_time'] / total, 'avg_nodes': aggregates['sum_nodes'] / total,
+                'best_time': aggregates['best_time'],
+                'by_difficulty': {int(bucket): {'count': count, 'avg_moves': moves / count, 'avg_time': t / count}
+                                  for bucket, (count, moves, t) in sorted(aggregates['buckets'].items(),
+                                                                          key=lambda item: int(item[0]))}}
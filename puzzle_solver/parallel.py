@@ -0,0 +1,206 @@
+"""Hash-distributed A* (HDA*): one search spread over worker processes that each own a slice of the states."""
+import heapq
+import multiprocessing
+import os
+import queue
+import time
+
+from .board import board_geometry, encode_state, decode_state, is_solvable
+from .heuristics import get_heuristic
+
+
+HDA_BATCH = 256  # children buffered per destination worker before they are sent
+HDA_EXPANSIONS = 64  # expansions between inbox checks; also how often the shared counters are refreshed
+HDA_POLL = 0.005  # seconds the coordinator and idle workers wait on their queues
+UNSOLVED = 1 << 62  # incumbent cost before any solution is found
+
+
+def _owner(code, workers):
+    """The worker that owns a packed state (Fibonacci hashing, so every cell's tile affects the result)."""
+    return ((code * 0x9E3779B97F4A7C15 & 0xFFFFFFFFFFFFFFFF) >> 32) % workers
+
+
+def _hda_worker(index, workers, initial_state, goal_state, heuristic, inboxes, results, shared):
+    """Runs A* over the states this worker owns and forwards other children to their owners in batches.
+
+    Besides child batches (lists of (f, g, code, blank cell, parent) tuples) the inbox carries ('trace', code),
+    answered on results with the parent of code, and ('stop',), answered with this worker's final counts.
+    """
+    incumbent, idle, activity, sent, received, expanded_counts, stored_counts = shared
+    bits, mask, neighbors = board_geometry(len(goal_state))
+    scorer = get_heuristic(heuristic, goal_state)
+    update = scorer.update
+    goal = encode_state(goal_state)
+    inbox = inboxes[index]
+    for other in inboxes:
+        other.cancel_join_thread()  # after an abort nobody drains the inboxes; exit without flushing into them
+    outboxes = [[] for _ in range(workers)]
+    open_list, best, parents = [], {}, {}
+    expanded = 0
+
+    def accept(f, g, code, blank, parent):
+        if g < best.get(code, g + 1):
+            best[code], parents[code] = g, parent
+            heapq.heappush(open_list, (f, g, code, blank))
+
+    def send(owner):
+        sent[index] += 1  # counted before the put, so a batch in transit always shows as sent but not received
+        inboxes[owner].put(outboxes[owner])
+        outboxes[owner] = []
+
+    start = encode_state(initial_state)
+    if _owner(start, workers) == index:
+        accept(scorer.evaluate(start), 0, start,
+               [tile for row in initial_state for tile in row].index(0), None)
+
+    while True:
+        busy = bool(open_list) and open_list[0][0] < incumbent.value
+        if not busy:
+            for owner, outbox in enumerate(outboxes):
+                if outbox:
+                    send(owner)
+            expanded_counts[index], stored_counts[index] = expanded, len(best)
+            idle[index] = 1
+        try:
+            message = inbox.get(timeout=HDA_POLL) if not busy else inbox.get_nowait()
+        except queue.Empty:
+            message = None
+        while message is not None:
+            if isinstance(message, list):
+                idle[index] = 0  # before the receive count, so the coordinator never sees idle and balanced
+                received[index] += 1
+                activity[index] += 1
+                for entry in message:
+                    accept(*entry)
+            elif message[0] == 'trace':
+                results.put(('parent', message[1], parents.get(message[1])))
+            else:
+                results.put(('stats', index, expanded, len(best)))
+                return
+            try:
+                message = inbox.get_nowait()
+            except queue.Empty:
+                message = None
+        if idle[index]:
+            continue
+
+        for _ in range(HDA_EXPANSIONS):
+            if not open_list:
+                break
+            f, g, code, blank = heapq.heappop(open_list)
+            if g > best[code]:
+                continue  # a cheaper route to this state arrived after this entry was pushed
+            bound = incumbent.value
+            if f >= bound:
+                open_list.clear()  # everything left is at least as expensive as the solution in hand
+                break
+            expanded += 1
+            if code == goal:
+                incumbent.value = g  # only the goal's owner ever writes it
+                continue
+            back, new_g, value = parents[code], g + 1, f - g
+            blank_shift = blank * bits
+            for cell in neighbors[blank]:
+                shift = cell * bits
+                tile = (code >> shift) & mask
+                new_code = code - (tile << shift) + (tile << blank_shift)
+                if new_code == back:
+                    continue
+                new_f = new_g + update(value, new_code, tile, cell, blank)
+                if new_f >= bound:
+                    continue
+                owner = _owner(new_code, workers)
+                if owner == index:
+                    accept(new_f, new_g, new_code, cell, code)
+                else:
+                    outboxes[owner].append((new_f, new_g, new_code, cell, code))
+                    if len(outboxes[owner]) >= HDA_BATCH:
+                        send(owner)
+        expanded_counts[index], stored_counts[index] = expanded, len(best)
+
+
+def solve_hda(initial_state, goal_state, telemetry=None, heuristic='manhattan', budget=None, workers=None,
+              stats=None):
+    """HDA*: A* whose states are hashed to `workers` processes (default: CPU count), each with its own open list
+    and closed set. Children owned by another worker are sent to it in batches of HDA_BATCH.
+
+    The search ends once a solution is in hand, every worker has nothing left below its cost and no batch is in
+    transit, so the path is optimal for admissible heuristics. It is then traced back by asking each state's
+    owner for its parent. If a stats dict is passed, it receives expanded_per_worker, stored_per_worker and
+    load_balance (busiest worker's expansions over the mean; 1.0 is perfect). Raises RuntimeError if a worker
+    dies before the search ends.
+    """
+    if not is_solvable(initial_state, goal_state):
+        return None, 0
+    get_heuristic(heuristic, goal_state)  # an unknown or unsupported heuristic fails here, not in every worker
+    size = len(initial_state)
+    workers = workers or os.cpu_count() or 1
+    incumbent = multiprocessing.RawValue('q', UNSOLVED)
+    # One slot per worker, written only by that worker, so none of these needs a lock.
+    idle, activity, sent, received, expanded_counts, stored_counts = (multiprocessing.RawArray('q', workers)
+                                                                      for _ in range(6))
+    shared = (incumbent, idle, activity, sent, received, expanded_counts, stored_counts)
+    inboxes = [multiprocessing.Queue() for _ in range(workers)]
+    results = multiprocessing.Queue()
+    processes = [multiprocessing.Process(target=_hda_worker, daemon=True,
+                                         args=(index, workers, initial_state, goal_state, heuristic, inboxes,
+                                               results, shared))
+                 for index in range(workers)]
+    for process in processes:
+        process.start()
+
+    finals = {}
+    try:
+        previous = None
+        while True:
+            time.sleep(HDA_POLL)
+            for index, process in enumerate(processes):
+                if process.exitcode is not None:  # workers only exit when told to stop
+                    raise RuntimeError(f"HDA worker {index} exited unexpectedly (exit code {process.exitcode})")
+            nodes = sum(expanded_counts)
+            if budget:
+                budget.check(nodes)
+            if telemetry and telemetry.due():
+                telemetry.publish(nodes, stored=sum(stored_counts))
+            # Idle flags are read before the counters; two identical readings with everyone idle and every
+            # sent batch received mean no worker woke up in between and none can wake up later.
+            snapshot = (list(idle), list(activity), sum(sent), sum(received))
+            if all(snapshot[0]) and snapshot[2] == snapshot[3] and snapshot == previous:
+                break
+            previous = snapshot
+
+        cost, path = incumbent.value, None
+        if cost != UNSOLVED:
+            codes = [encode_state(goal_state)]
+            while True:
+                inboxes[_owner(codes[-1], workers)].put(('trace', codes[-1]))
+                parent = results.get()[2]
+                if parent is None:
+                    break
+                codes.append(parent)
+            path = [decode_state(code, size) for code in reversed(codes)]
+    finally:
+        for inbox in inboxes:
+            inbox.put(('stop',))
+        for _ in range(workers):
+            try:
+                message = results.get(timeout=1)
+            except queue.Empty:
+                break
+            if message[0] == 'stats':
+                finals[message[1]] = message[2:]
+        deadline = time.perf_counter() + 1
+        for process in processes:
+            process.join(timeout=max(0, deadline - time.perf_counter()))
+            if process.is_alive():
+                process.terminate()
+
+    expanded = [finals.get(index, (expanded_counts[index],))[0] for index in range(workers)]
+    stored = [finals.get(index, (0, stored_counts[index]))[1] for index in range(workers)]
+    nodes = sum(expanded)
+    if stats is not None:
+        stats.update(expanded_per_worker=expanded, stored_per_worker=stored,
+                     load_balance=max(expanded) * workers / nodes if nodes else 1.0)
+    if telemetry:
+        telemetry.publish(nodes, stored=sum(stored), max_depth=len(path) - 1 if path else 0)
+    return path, nodes
@@ -0,0 +1,534 @@
+"""The search algorithms, their budgets and telemetry, and the solve_puzzle entry point."""
+import heapq
+import functools
+import threading
+import time
+import cProfile
+
+try:
+    import resource  # peak RSS in telemetry; Unix only
+except ImportError:
+    resource = None
+
+from .board import board_geometry, encode_state, decode_state, _reconstruct_path, is_solvable
+from .heuristics import get_heuristic
+from .tables import _solve_with_table
+
+
+# --- Cancellation and Budgets ---
+
+BUDGET_INTERVAL = 64  # expansions between cancellation/budget checks
+
+
+class CancelToken:
+    """Lets another thread (e.g. the GUI's Reset button) stop a running solve."""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+
+class SearchAborted(Exception):
+    """Raised by a solver that was cancelled or ran out of its node/time budget."""
+
+    def __init__(self, reason, nodes_explored):
+        super().__init__(f"Search stopped ({reason}) after {nodes_explored} nodes")
+        self.reason, self.nodes_explored = reason, nodes_explored
+
+
+class SearchBudget:
+    """A cancel token plus node and wall-clock limits, checked by the solvers every BUDGET_INTERVAL expansions."""
+
+    def __init__(self, cancel=None, max_nodes=None, time_limit=None):
+        self.cancel, self.max_nodes = cancel, max_nodes
+        self.deadline = time.perf_counter() + time_limit if time_limit is not None else None
+
+    def check(self, nodes_explored):
+        if self.cancel is not None and self.cancel.cancelled:
+            raise SearchAborted('cancelled', nodes_explored)
+        if self.max_nodes is not None and nodes_explored >= self.max_nodes:
+            raise SearchAborted('node budget', nodes_explored)
+        if self.deadline is not None and time.perf_counter() >= self.deadline:
+            raise SearchAborted('time limit', nodes_explored)
+
+
+# --- Telemetry ---
+
+TELEMETRY_INTERVAL = 0.05  # seconds between published snapshots
+
+
+class SearchTelemetry:
+    """Structured progress of one search, published at most every `interval` seconds.
+
+    Each publish replaces `snapshot` with a new dict (never mutating the old one), so another thread can poll
+    it without a lock. on_publish, if given, is called with every new snapshot on the search thread.
+    """
+
+    def __init__(self, interval=TELEMETRY_INTERVAL, on_publish=None):
+        self.interval, self.on_publish = interval, on_publish
+        self.snapshot = None
+        self.start()
+
+    def start(self):
+        self.started = time.perf_counter()
+        self.next_publish = self.started + self.interval
+
+    def due(self):
+        return time.perf_counter() >= self.next_publish
+
+    def publish(self, expanded, generated=0, duplicates=0, open_size=0, stored=0, max_depth=0, evaluations=0):
+        now = time.perf_counter()
+        elapsed = now - self.started
+        self.snapshot = snapshot = {
+            'expanded': expanded, 'generated': generated, 'duplicates': duplicates, 'open': open_size,
+            'stored': stored, 'max_depth': max_depth, 'evaluations': evaluations, 'elapsed': elapsed,
+            'nodes_per_sec': expanded / elapsed if elapsed > 0 else 0.0,
+            'peak_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else None}
+        self.next_publish = now + self.interval
+        if self.on_publish:
+            self.on_publish(snapshot)
+
+
+# --- Open Lists ---
+
+OPEN_LISTS = ('bucket', 'lifo', 'heap')  # A* open-list structures; see _open_list
+
+
+class BucketQueue:
+    """Open list for small non-negative integer f-values: one bucket per f, lowest f popped first.
+
+    Within a bucket, tie_break 'deep' pops the largest g first, so the last f-layer dives straight for the goal;
+    'lifo' pops the newest entry. Nothing is removed early: to re-prioritize a state, push it again and skip the
+    stale entry when it comes out (the solvers check g against their best-g map), which also keeps the queue
+    correct for inconsistent heuristics, whose f can drop below the current minimum.
+    """
+
+    def __init__(self, tie_break='deep'):
+        self.deep = tie_break == 'deep'
+        self._buckets, self._counts, self._top_g = [], [], []  # per f: entries, entry count, highest g pushed
+        self._min_f = self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def push(self, entry):
+        """Adds an (f, g, code, blank) entry."""
+        f, g, code, blank = entry
+        buckets = self._buckets
+        while len(buckets) <= f:
+            buckets.append([])
+            self._counts.append(0)
+            self._top_g.append(0)
+        if self.deep:
+            stacks = buckets[f]  # one stack per g
+            while len(stacks) <= g:
+                stacks.append([])
+            stacks[g].append((code, blank))
+            if g > self._top_g[f]:
+                self._top_g[f] = g
+        else:
+            buckets[f].append(entry)
+        self._counts[f] += 1
+        self._size += 1
+        if f < self._min_f:
+            self._min_f = f
+
+    def pop(self):
+        """Removes and returns the (f, g, code, blank) entry with the lowest f."""
+        if not self._size:
+            raise IndexError("pop from an empty BucketQueue")
+        counts, f = self._counts, self._min_f
+        while not counts[f]:
+            f += 1
+        self._min_f = f
+        counts[f] -= 1
+        self._size -= 1
+        if not self.deep:
+            return self._buckets[f].pop()
+        stacks, g = self._buckets[f], self._top_g[f]
+        while not stacks[g]:
+            g -= 1
+        self._top_g[f] = g
+        code, blank = stacks[g].pop()
+        return f, g, code, blank
+
+
+def _open_list(kind):
+    """(push, pop, container) for an OPEN_LISTS kind; push and pop take and return (f, g, code, blank).
+
+    'bucket' is a BucketQueue popping the deepest g first and 'lifo' one popping the newest entry; 'heap' is a
+    binary heap whose ties on f go to the smallest g, the order A* used before bucket queues.
+    """
+    if kind == 'heap':
+        heap = []
+        return functools.partial(heapq.heappush, heap), functools.partial(heapq.heappop, heap), heap
+    if kind not in OPEN_LISTS:
+        raise ValueError(f"Unknown open list {kind!r}; expected one of {', '.join(OPEN_LISTS)}")
+    queue = BucketQueue('deep' if kind == 'bucket' else 'lifo')
+    return queue.push, queue.pop, queue
+
+
+def _solve_astar(initial_state, goal_state, telemetry=None, heuristic='manhattan', budget=None,
+                 open_list='bucket', stats=None):
+    """A* solver that works with a custom goal state.
+
+    Open-list entries only carry (cost, moves, packed state, blank cell); the path is rebuilt once from the
+    parent map when the goal is reached. open_list picks the structure (see OPEN_LISTS). If a stats dict is
+    passed, it receives final_layer: the nodes expanded at the solution's f-value.
+    """
+    if not is_solvable(initial_state, goal_state):
+        return None, 0
+    size = len(initial_state)
+    bits, mask, neighbors = board_geometry(size)
+    scorer = get_heuristic(heuristic, goal_state)
+    update = scorer.update
+    goal = encode_state(goal_state)
+    start = encode_state(initial_state)
+    start_blank = [tile for row in initial_state for tile in row].index(0)
+
+    push, pop, pq = _open_list(open_list)
+    push((scorer.evaluate(start), 0, start, start_blank))
+    parents = {start: None}
+    best_moves = {start: 0}
+    nodes_explored = generated = duplicates = max_depth = 0
+    layer_cost = layer_nodes = 0
+    path = None
+
+    while pq:
+        cost, moves, code, blank = pop()
+        if moves > best_moves[code]:
+            duplicates += 1
+            continue  # A cheaper route to this state was found after this entry was pushed.
+        nodes_explored += 1
+        if moves > max_depth:
+            max_depth = moves
+        if cost != layer_cost:
+            layer_cost, layer_nodes = cost, 0
+        layer_nodes += 1
+
+        if nodes_explored % BUDGET_INTERVAL == 0:
+            if budget:
+                budget.check(nodes_explored)
+            if telemetry and telemetry.due():
+                telemetry.publish(nodes_explored, generated, duplicates, len(pq), len(best_moves), max_depth,
+                                  generated)
+
+        if code == goal:
+            path = _reconstruct_path(parents, code, size)
+            break
+
+        new_moves, value = moves + 1, cost - moves
+        blank_shift = blank * bits
+        for cell in neighbors[blank]:
+            shift = cell * bits
+            tile = (code >> shift) & mask
+            new_code = code - (tile << shift) + (tile << blank_shift)
+            if new_moves < best_moves.get(new_code, new_moves + 1):
+                best_moves[new_code] = new_moves
+                parents[new_code] = code
+                push((new_moves + update(value, new_code, tile, cell, blank), new_moves, new_code, cell))
+                generated += 1
+            else:
+                duplicates += 1
+    if telemetry:
+        telemetry.publish(nodes_explored, generated, duplicates, len(pq), len(best_moves), max_depth, generated)
+    if stats is not None:
+        stats['final_layer'] = layer_nodes
+    return path, nodes_explored
+
+
+def _solve_idastar(initial_state, goal_state, telemetry=None, heuristic='manhattan', budget=None,
+                   transposition_limit=0, on_iteration=None):
+    """Iterative-deepening A*: memory only grows with the solution depth.
+
+    Never moves the blank straight back to where it came from. With transposition_limit > 0, up to that many
+    states per iteration remember the fewest moves they were reached in, pruning repeat visits that cannot do
+    better. on_iteration(iteration, threshold, nodes_explored) is called after each deepening pass.
+    """
+    if not is_solvable(initial_state, goal_state):
+        return None, 0
+    size = len(initial_state)
+    bits, mask, neighbors = board_geometry(size)
+    scorer = get_heuristic(heuristic, goal_state)
+    update = scorer.update
+    goal = encode_state(goal_state)
+    start = encode_state(initial_state)
+    path = [start]
+    transpositions = {}
+    nodes_explored = generated = duplicates = max_depth = 0
+    found = -1
+
+    def search(code, blank, previous, moves, value, threshold):
+        nonlocal nodes_explored, generated, duplicates, max_depth
+        generated += 1
+        cost = moves + value
+        if cost > threshold:
+            return cost
+        nodes_explored += 1
+        if moves > max_depth:
+            max_depth = moves
+        if nodes_explored % BUDGET_INTERVAL == 0:
+            if budget:
+                budget.check(nodes_explored)
+            if telemetry and telemetry.due():
+                telemetry.publish(nodes_explored, generated, duplicates, len(path), len(transpositions), max_depth,
+                                  generated)
+        if code == goal:
+            return found
+        minimum = float('inf')
+        new_moves = moves + 1
+        blank_shift = blank * bits
+        for cell in neighbors[blank]:
+            if cell == previous:
+                continue
+            shift = cell * bits
+            tile = (code >> shift) & mask
+            new_code = code - (tile << shift) + (tile << blank_shift)
+            if transposition_limit:
+                if transpositions.get(new_code, new_moves + 1) <= new_moves:
+                    duplicates += 1
+                    continue
+                if len(transpositions) < transposition_limit or new_code in transpositions:
+                    transpositions[new_code] = new_moves
+            path.append(new_code)
+            result = search(new_code, cell, blank, new_moves, update(value, new_code, tile, cell, blank), threshold)
+            if result == found:
+                return found
+            path.pop()
+            minimum = min(minimum, result)
+        return minimum
+
+    start_blank = [tile for row in initial_state for tile in row].index(0)
+    estimate = scorer.evaluate(start)
+    threshold, iteration = estimate, 0
+    while True:
+        iteration += 1
+        transpositions.clear()
+        result = search(start, start_blank, None, 0, estimate, threshold)
+        if on_iteration:
+            on_iteration(iteration, threshold, nodes_explored)
+        if result == found or result == float('inf'):
+            break
+        threshold = result
+    if telemetry:
+        telemetry.publish(nodes_explored, generated, duplicates, len(path), len(transpositions), max_depth,
+                          generated)
+    return ([decode_state(code, size) for code in path] if result == found else None), nodes_explored
+
+
+def _solve_bidirectional(initial_state, goal_state, telemetry=None, heuristic=None, budget=None, stats=None):
+    """Meet-in-the-middle BFS that grows whichever of the start and goal frontiers is smaller, one layer at a time.
+
+    The first state reached from both sides lies on a shortest path. If a stats dict is passed, it receives
+    forward_nodes/backward_nodes (states expanded from each side) and forward_depth/backward_depth.
+    """
+    if not is_solvable(initial_state, goal_state):
+        return None, 0
+    size = len(initial_state)
+    bits, mask, neighbors = board_geometry(size)
+    start, goal = encode_state(initial_state), encode_state(goal_state)
+    start_blank = [tile for row in initial_state for tile in row].index(0)
+    goal_blank = [tile for row in goal_state for tile in row].index(0)
+    parents = ({start: None}, {goal: None})
+    frontiers = ([(start, start_blank)], [(goal, goal_blank)])
+    expanded, depths = [0, 0], [0, 0]
+    duplicates = 0
+    meeting = start if start == goal else None
+
+    while meeting is None:
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        own, other = parents[side], parents[1 - side]
+        next_frontier = []
+        for code, blank in frontiers[side]:
+            expanded[side] += 1
+            if (expanded[0] + expanded[1]) % BUDGET_INTERVAL == 0:
+                if budget:
+                    budget.check(expanded[0] + expanded[1])
+                if telemetry and telemetry.due():
+                    telemetry.publish(expanded[0] + expanded[1], len(own) + len(other) - 2, duplicates,
+                                      len(frontiers[side]) + len(next_frontier), len(own) + len(other),
+                                      depths[0] + depths[1])
+            blank_shift = blank * bits
+            for cell in neighbors[blank]:
+                shift = cell * bits
+                tile = (code >> shift) & mask
+                new_code = code - (tile << shift) + (tile << blank_shift)
+                if new_code not in own:
+                    own[new_code] = code
+                    if new_code in other:
+                        meeting = new_code
+                        break
+                    next_frontier.append((new_code, cell))
+                else:
+                    duplicates += 1
+            if meeting is not None:
+                break
+        depths[side] += 1
+        frontiers[side][:] = next_frontier
+
+    if stats is not None:
+        stats.update(forward_nodes=expanded[0], backward_nodes=expanded[1], forward_depth=depths[0],
+                     backward_depth=depths[1])
+    if telemetry:
+        telemetry.publish(expanded[0] + expanded[1], len(parents[0]) + len(parents[1]) - 2, duplicates,
+                          len(frontiers[0]) + len(frontiers[1]), len(parents[0]) + len(parents[1]),
+                          depths[0] + depths[1])
+    # Start -> meeting comes from the forward parents; meeting -> goal follows the backward parents.
+    path = _reconstruct_path(parents[0], meeting, size)
+    code = parents[1][meeting]
+    while code is not None:
+        path.append(decode_state(code, size))
+        code = parents[1][code]
+    return path, expanded[0] + expanded[1]
+
+
+def _weighted_astar(start, start_blank, goal, size, scorer, weight, bound, budget, telemetry, nodes_offset):
+    """A* on g + weight * h that ignores anything whose g + h cannot beat `bound` (the incumbent's length)."""
+    bits, mask, neighbors = board_geometry(size)
+    update = scorer.update
+    estimate = scorer.evaluate(start)
+    pq = [(weight * estimate, 0, start, start_blank, estimate)]
+    parents = {start: None}
+    best_moves = {start: 0}
+    nodes_explored = generated = duplicates = evaluations = max_depth = 0
+    path = None
+
+    while pq:
+        _, moves, code, blank, value = heapq.heappop(pq)
+        if moves > best_moves[code]:
+            duplicates += 1
+            continue
+        nodes_explored += 1
+        if moves > max_depth:
+            max_depth = moves
+        if nodes_explored % BUDGET_INTERVAL == 0:
+            if budget:
+                budget.check(nodes_offset + nodes_explored)
+            if telemetry and telemetry.due():
+                telemetry.publish(nodes_offset + nodes_explored, generated, duplicates, len(pq), len(best_moves),
+                                  max_depth, evaluations)
+        if code == goal:
+            path = _reconstruct_path(parents, code, size)
+            break
+
+        new_moves = moves + 1
+        blank_shift = blank * bits
+        for cell in neighbors[blank]:
+            shift = cell * bits
+            tile = (code >> shift) & mask
+            new_code = code - (tile << shift) + (tile << blank_shift)
+            if new_moves < best_moves.get(new_code, new_moves + 1):
+                new_value = update(value, new_code, tile, cell, blank)
+                evaluations += 1
+                if new_moves + new_value >= bound:
+                    continue
+                best_moves[new_code] = new_moves
+                parents[new_code] = code
+                heapq.heappush(pq, (new_moves + weight * new_value, new_moves, new_code, cell, new_value))
+                generated += 1
+            else:
+                duplicates += 1
+    if telemetry:
+        telemetry.publish(nodes_offset + nodes_explored, generated, duplicates, len(pq), len(best_moves), max_depth,
+                          evaluations)
+    return path, nodes_explored
+
+
+def _solve_anytime(initial_state, goal_state, telemetry=None, heuristic='manhattan', budget=None,
+                   weights=(3.0, 2.0, 1.5, 1.25, 1.0), on_solution=None):
+    """Anytime weighted A*: a quick, possibly longer path first, then shorter ones as the weight drops to 1.
+
+    Each pass restarts weighted A* and prunes everything that cannot beat the best path so far, so the final
+    weight-1 pass proves the incumbent optimal. on_solution(path, nodes_explored, proven_optimal) is called for
+    every improvement and once more when optimality is proven. When the budget runs out, the best path found so
+    far is returned (SearchAborted is only raised if there is none yet).
+    """
+    if not is_solvable(initial_state, goal_state):
+        return None, 0
+    size = len(initial_state)
+    scorer = get_heuristic(heuristic, goal_state)
+    start, goal = encode_state(initial_state), encode_state(goal_state)
+    start_blank = [tile for row in initial_state for tile in row].index(0)
+    weights = [w for w in weights if w > 1] + [1]
+    best_path, nodes_explored = None, 0
+    try:
+        for weight in weights:
+            bound = len(best_path) - 1 if best_path else float('inf')  # moves in the incumbent
+            path, nodes = _weighted_astar(start, start_blank, goal, size, scorer, weight, bound, budget, telemetry,
+                                          nodes_explored)
+            nodes_explored += nodes
+            if path is not None:
+                best_path = path
+                if on_solution:
+                    on_solution(best_path, nodes_explored, weight == 1)
+            elif weight == 1 and on_solution:
+                on_solution(best_path, nodes_explored, True)
+    except SearchAborted as aborted:
+        if best_path is None:
+            raise
+        nodes_explored = aborted.nodes_explored
+    return best_path, nodes_explored
+
+
+def _solve_vectorized(initial_state, goal_state, telemetry=None, heuristic=None, budget=None):
+    """Imports the NumPy solver on first use, so nothing else in the package ever loads NumPy."""
+    try:
+        from .vectorized import solve_vectorized
+    except ImportError:
+        raise ValueError("The 'vectorized' solver needs NumPy (pip install numpy)") from None
+    return solve_vectorized(initial_state, goal_state, telemetry, heuristic, budget)
+
+
+def _solve_hda(initial_state, goal_state, telemetry=None, heuristic='manhattan', budget=None, **options):
+    """Imports the multiprocess solver on first use."""
+    from .parallel import solve_hda
+    return solve_hda(initial_state, goal_state, telemetry, heuristic, budget, **options)
+
+
+SOLVERS = {'astar': _solve_astar, 'idastar': _solve_idastar, 'bidirectional': _solve_bidirectional,
+           'anytime': _solve_anytime, 'vectorized': _solve_vectorized, 'hda': _solve_hda,
+           'table': _solve_with_table}
+SUBOPTIMAL_SOLVERS = {'anytime'}  # may return a longer path when stopped by its budget
+
+
+def solve_puzzle(initial_state, goal_state, callback=None, algorithm='astar', heuristic='manhattan', cancel=None,
+                 max_nodes=None, time_limit=None, telemetry=None, profile=None, **options):
+    """Solves the puzzle with the chosen algorithm and returns (path of boards, nodes explored).
+
+    'astar' and 'idastar' search with the chosen heuristic (see HEURISTICS); 'bidirectional' runs a blind
+    meet-in-the-middle BFS; 'anytime' streams improving paths until one is proven optimal; 'vectorized' expands
+    whole depth layers with NumPy; 'hda' spreads one A* search over worker processes; 'table' walks the
+    precomputed distance table. Extra keyword options are passed to the algorithm (e.g. transposition_limit for
+    'idastar', open_list for 'astar', stats for 'astar', 'bidirectional' and 'hda', workers for 'hda',
+    on_solution for 'anytime').
+
+    cancel (a CancelToken), max_nodes and time_limit (seconds) stop the search with SearchAborted.
+
+    Progress goes to telemetry (a SearchTelemetry), which ends with a final snapshot of the whole search;
+    callback(nodes_explored, states_stored) is shorthand for one that forwards its snapshots. profile, a cProfile
+    Profile or a filename to dump stats to, profiles the search.
+    """
+    if algorithm not in SOLVERS:
+        raise ValueError(f"Unknown algorithm {algorithm!r}; expected one of {', '.join(SOLVERS)}")
+    limited = cancel is not None or max_nodes is not None or time_limit is not None
+    budget = SearchBudget(cancel, max_nodes, time_limit) if limited else None
+    if callback and telemetry is None:
+        telemetry = SearchTelemetry(on_publish=lambda snapshot: callback(snapshot['expanded'], snapshot['stored']))
+    if telemetry:
+        telemetry.start()
+    solver = SOLVERS[algorithm]
+    if profile is None:
+        return solver(initial_state, goal_state, telemetry, heuristic=heuristic, budget=budget, **options)
+    profiler = profile if isinstance(profile, cProfile.Profile) else cProfile.Profile()
+    try:
+        return profiler.runcall(solver, initial_state, goal_state, telemetry, heuristic=heuristic, budget=budget,
+                                **options)
+    finally:
+        if profiler is not profile:
+            profiler.dump_stats(profile)
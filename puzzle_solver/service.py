@@ -0,0 +1,234 @@
+"""Local solve service: JSON lines over a Unix socket or localhost TCP, solved on a process pool."""
+import asyncio
+import json
+import os
+import socket
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from .board import default_goal, encode_state, is_valid_board
+from .search import SearchAborted, solve_puzzle
+from .batch import _worker_cache, _board_error
+from .bench import _percentile
+
+
+# --- Local Solve Service ---
+# Each line a client sends is one JSON object: {"id": any, "initial": board, "goal": board, "algorithm": str,
+# "heuristic": str, "max_nodes": int, "time_limit": seconds, "timeout": seconds, "with_path": bool} (only
+# "initial" is required) to solve a puzzle, or {"op": "metrics"}. Every reply is one JSON line carrying the
+# request's id, written as soon as that result is ready, so a client can pipeline requests on one connection
+# and read the answers back in completion order. Identical requests that are still queued or running share a
+# single computation, and once max_pending distinct computations are outstanding new ones are refused.
+
+SERVICE_ADDRESS = '127.0.0.1:8765'
+SERVICE_TIMEOUT = 30.0  # seconds a request waits for its result unless it asks otherwise
+SERVICE_MAX_SOLVE = 30.0  # seconds any one computation may run in a worker
+LATENCY_WINDOW = 1024  # recent request latencies behind the metrics percentiles
+SOLVE_OPTIONS = {'algorithm': str, 'heuristic': str, 'max_nodes': int, 'time_limit': (int, float)}
+
+
+def _split_address(address):
+    """'host:port' -> (host, port); anything else is a Unix socket path -> (path, None)."""
+    host, sep, port = address.rpartition(':')
+    if sep and port.isdigit() and '/' not in address:
+        return host or '127.0.0.1', int(port)
+    return address, None
+
+
+def _solve_request(initial_state, goal_state, options, cache_file=None):
+    """Runs in a worker process and returns the reply fields of one computation."""
+    cache = _worker_cache(cache_file)
+    start_time = time.perf_counter()
+    try:
+        if cache is None:
+            path, nodes = solve_puzzle(initial_state, goal_state, **options)
+        else:
+            path, nodes = cache.solve(initial_state, goal_state, **options)
+    except SearchAborted as aborted:
+        return {'error': str(aborted), 'aborted': aborted.reason, 'nodes': aborted.nodes_explored}
+    except ValueError as e:  # e.g. a mode that does not support this board size
+        return {'error': str(e)}
+    return {'moves': len(path) - 1, 'nodes': nodes, 'time': round(time.perf_counter() - start_time, 6),
+            'path': path}
+
+
+class SolveService:
+    """Answers solve requests from a process pool, coalescing duplicates and shedding load past max_pending."""
+
+    def __init__(self, workers=None, max_pending=None, timeout=SERVICE_TIMEOUT, max_solve_time=SERVICE_MAX_SOLVE,
+                 cache_file=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending or self.workers * 8
+        self.timeout, self.max_solve_time, self.cache_file = timeout, max_solve_time, cache_file
+        self._pool = ProcessPoolExecutor(self.workers)
+        self._jobs = {}  # request key -> [pool future, asyncio future, waiting requests]
+        self._latencies = deque(maxlen=LATENCY_WINDOW)
+        self.counters = dict.fromkeys(('requests', 'solved', 'failed', 'coalesced', 'shed', 'timeouts'), 0)
+        self.started = time.time()
+
+    def _parse(self, request):
+        initial_state, goal = request.get('initial'), request.get('goal')
+        if goal is None and is_valid_board(initial_state):
+            goal = default_goal(len(initial_state))
+        error = _board_error(initial_state, goal)
+        if error:
+            raise ValueError(error)
+        options = {}
+        for name, kind in SOLVE_OPTIONS.items():
+            value = request.get(name)
+            if value is not None:
+                if not isinstance(value, kind) or isinstance(value, bool):
+                    raise ValueError(f"'{name}' has the wrong type")
+                options[name] = value
+        # Every computation gets a wall-clock budget so an abandoned search cannot hold a worker forever.
+        options['time_limit'] = min(options.get('time_limit', self.max_solve_time), self.max_solve_time)
+        timeout = request.get('timeout') or self.timeout
+        if not isinstance(timeout, (int, float)) or timeout <= 0:
+            raise ValueError("'timeout' must be a positive number of seconds")
+        key = (len(goal), encode_state(initial_state), encode_state(goal), tuple(sorted(options.items())))
+        return initial_state, goal, options, timeout, key
+
+    def _submit(self, key, initial_state, goal, options):
+        pool_future = self._pool.submit(_solve_request, initial_state, goal, options, self.cache_file)
+        job = self._jobs[key] = [pool_future, asyncio.wrap_future(pool_future), 0]
+
+        def finished(_):
+            if self._jobs.get(key) is job:
+                del self._jobs[key]
+        job[1].add_done_callback(finished)
+        return job
+
+    async def solve(self, request):
+        """Answers one request dict with a reply dict; bad input, load shedding and timeouts become 'error'."""
+        start_time = time.perf_counter()
+        reply = {'id': request['id']} if 'id' in request else {}
+        self.counters['requests'] += 1
+        try:
+            initial_state, goal, options, timeout, key = self._parse(request)
+        except ValueError as e:
+            self.counters['failed'] += 1
+            reply['error'] = str(e)
+            return reply
+        job = self._jobs.get(key)
+        if job is not None and not job[0].done():
+            self.counters['coalesced'] += 1
+        elif len(self._jobs) >= self.max_pending:
+            self.counters['shed'] += 1
+            reply.update(error='overloaded: too many pending requests, retry later', shed=True)
+            return reply
+        else:
+            job = self._submit(key, initial_state, goal, options)
+        job[2] += 1
+        try:
+            result = await asyncio.wait_for(asyncio.shield(job[1]), timeout)
+        except asyncio.TimeoutError:
+            self.counters['timeouts'] += 1
+            reply.update(error=f"no result within {timeout:g}s", aborted='timeout')
+            return reply
+        except Exception as e:  # a crashed or shut-down worker pool
+            self.counters['failed'] += 1
+            reply['error'] = f"solver failed: {e!r}"
+            return reply
+        finally:
+            job[2] -= 1
+            if not job[2]:
+                job[0].cancel()  # nobody is waiting any more; drops the job if it has not started yet
+        self.counters['failed' if 'error' in result else 'solved'] += 1
+        latency = time.perf_counter() - start_time
+        self._latencies.append(latency)
+        reply.update(result, latency=round(latency, 6))
+        if not request.get('with_path'):
+            reply.pop('path', None)
+        return reply
+
+    def metrics(self):
+        """Queue depth, request counters and latency percentiles over the last LATENCY_WINDOW requests."""
+        # The pool marks a job running once it is handed to its call queue, which holds one more than it has workers.
+        running = min(sum(job[0].running() for job in self._jobs.values()), self.workers)
+        latencies = sorted(self._latencies)
+        return {'pending': len(self._jobs), 'running': running, 'queued': len(self._jobs) - running,
+                'max_pending': self.max_pending, 'workers': self.workers, **self.counters,
+                'latency_p50': _percentile(latencies, 0.50), 'latency_p95': _percentile(latencies, 0.95),
+                'latency_p99': _percentile(latencies, 0.99), 'uptime': round(time.time() - self.started, 1)}
+
+    async def _answer(self, line, writer, lock):
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError
+        except ValueError:
+            reply = {'error': 'invalid JSON (expected one object per line)'}
+        else:
+            if request.get('op') == 'metrics':
+                reply = {'id': request['id'], **self.metrics()} if 'id' in request else self.metrics()
+            else:
+                reply = await self.solve(request)
+        async with lock:
+            writer.write(json.dumps(reply, separators=(',', ':')).encode() + b'\n')
+            await writer.drain()
+
+    async def _handle_connection(self, reader, writer):
+        lock, answers = asyncio.Lock(), set()
+        try:
+            while line := await reader.readline():
+                if line.strip():
+                    answer = asyncio.ensure_future(self._answer(line, writer, lock))
+                    answers.add(answer)
+                    answer.add_done_callback(answers.discard)
+            if answers:
+                await asyncio.gather(*answers, return_exceptions=True)
+        except (ConnectionError, ValueError):  # client went away, or sent an over-long line
+            pass
+        finally:
+            for answer in answers:
+                answer.cancel()
+            writer.close()
+
+    async def serve(self, address=SERVICE_ADDRESS):
+        """Listens on address (host:port, or a Unix socket path) until cancelled."""
+        host, port = _split_address(address)
+        if port is None:
+            server = await asyncio.start_unix_server(self._handle_connection, host)
+        else:
+            server = await asyncio.start_server(self._handle_connection, host, port)
+        async with server:
+            await server.serve_forever()
+
+    def close(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+def request_solve(address, initial_state, goal_state=None, cancel=None, timeout=None, **options):
+    """Solves one puzzle through a running service and returns (path, nodes), like solve_puzzle.
+
+    Raises SearchAborted if the service gave up, timed out or cancel was set while waiting, ValueError for
+    anything the service refused (bad input, overload) and OSError if it cannot be reached.
+    """
+    request = {'initial': initial_state, 'goal': goal_state, 'with_path': True, 'timeout': timeout, **options}
+    host, port = _split_address(address)
+    if port is None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(host)
+    else:
+        sock = socket.create_connection((host, port))
+    with sock:
+        sock.sendall(json.dumps(request).encode() + b'\n')
+        sock.settimeout(0.1)  # wake up regularly to notice cancellation
+        data = b''
+        while not data.endswith(b'\n'):
+            if cancel is not None and cancel.cancelled:
+                raise SearchAborted('cancelled', 0)
+            try:
+                chunk = sock.recv(65536)
+            except socket.timeout:
+                continue
+            if not chunk:
+                raise ConnectionError("the solve service closed the connection")
+            data += chunk
+    reply = json.loads(data)
+    if 'aborted' in reply:
+        raise SearchAborted(reply['aborted'], reply.get('nodes', 0))
+    if 'error' in reply:
+        raise ValueError(reply['error'])
+    return reply['path'], reply['nodes']
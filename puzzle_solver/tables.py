@@ -0,0 +1,140 @@
+"""Memory-mapped 3x3 distance tables and the instant 'table' solve mode."""
+import threading
+import os
+import mmap
+import struct
+import zlib
+
+from .board import CELL_BITS, CELL_MASK, NEIGHBORS, encode_state, decode_state
+
+
+# --- Distance Table (instant optimal solves) ---
+# One BFS per goal blank cell stores the optimal distance of every reachable board as one byte, indexed by
+# the board's permutation (Lehmer) rank. Any goal with the blank in that cell is served from the same table by
+# relabelling the tiles, so a solve is just a downhill walk of table lookups.
+
+DISTANCE_TABLE_DIR = 'puzzle_tables'
+TABLE_MAGIC, TABLE_VERSION = b'8PZT', 1
+TABLE_HEADER = struct.Struct('<4sHHI')  # magic, version, goal blank cell, crc32 of the distances
+TABLE_SIZE = 362880  # 9!
+UNREACHABLE = 0xFF
+_distance_tables = {}
+_distance_tables_lock = threading.Lock()
+
+
+def permutation_rank(code):
+    """Returns the Lehmer rank (0 .. 9!-1) of a packed state."""
+    tiles = [(code >> (i * CELL_BITS)) & CELL_MASK for i in range(9)]
+    rank = 0
+    for i in range(8):
+        tile = tiles[i]
+        rank = rank * (9 - i) + sum(1 for later in tiles[i + 1:] if later < tile)
+    return rank
+
+
+def _reference_goal(blank_cell):
+    """The goal a table is built against: tiles 1-8 in reading order with the blank at blank_cell."""
+    tiles = list(range(1, 9))
+    tiles.insert(blank_cell, 0)
+    return [tiles[r * 3:r * 3 + 3] for r in range(3)]
+
+
+def _build_distance_table(blank_cell):
+    distances = bytearray([UNREACHABLE]) * TABLE_SIZE
+    goal = encode_state(_reference_goal(blank_cell))
+    distances[permutation_rank(goal)] = 0
+    seen, frontier, depth = {goal}, [(goal, blank_cell)], 0
+    while frontier:
+        depth += 1
+        next_frontier = []
+        for code, blank in frontier:
+            blank_shift = blank * CELL_BITS
+            for cell in NEIGHBORS[blank]:
+                shift = cell * CELL_BITS
+                tile = (code >> shift) & CELL_MASK
+                new_code = code - (tile << shift) + (tile << blank_shift)
+                if new_code not in seen:
+                    seen.add(new_code)
+                    distances[permutation_rank(new_code)] = depth
+                    next_frontier.append((new_code, cell))
+        frontier = next_frontier
+    return distances
+
+
+def _table_path(blank_cell):
+    return os.path.join(DISTANCE_TABLE_DIR, f'distance_b{blank_cell}.bin')
+
+
+def _open_distance_table(path, blank_cell):
+    """Maps a table file read-only, or returns None if it is missing, stale or corrupt."""
+    if not os.path.exists(path) or os.path.getsize(path) != TABLE_HEADER.size + TABLE_SIZE:
+        return None
+    with open(path, 'rb') as f:
+        table = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, version, cell, checksum = TABLE_HEADER.unpack_from(table)
+    if (magic, version, cell) != (TABLE_MAGIC, TABLE_VERSION, blank_cell) or \
+            zlib.crc32(table[TABLE_HEADER.size:]) != checksum:
+        table.close()
+        return None
+    return table
+
+
+def load_distance_table(blank_cell):
+    """Returns the memory-mapped distance table for goals with the blank at blank_cell, building it on first use."""
+    with _distance_tables_lock:
+        if blank_cell in _distance_tables:
+            return _distance_tables[blank_cell]
+        path = _table_path(blank_cell)
+        table = _open_distance_table(path, blank_cell)
+        if table is None:
+            distances = _build_distance_table(blank_cell)
+            os.makedirs(DISTANCE_TABLE_DIR, exist_ok=True)
+            tmp_path = f'{path}.{os.getpid()}.tmp'  # batch workers may build the same table at once
+            with open(tmp_path, 'wb') as f:
+                f.write(TABLE_HEADER.pack(TABLE_MAGIC, TABLE_VERSION, blank_cell, zlib.crc32(distances)))
+                f.write(distances)
+            os.replace(tmp_path, path)
+            table = _open_distance_table(path, blank_cell)
+        _distance_tables[blank_cell] = table
+        return table
+
+
+def _solve_with_table(initial_state, goal_state, telemetry=None, heuristic=None, budget=None):
+    """Returns an optimal path by walking downhill in the precomputed distance table (no search)."""
+    if len(initial_state) != 3 or len(goal_state) != 3:
+        raise ValueError("The distance table only covers 3x3 boards")
+    flat_goal = [tile for row in goal_state for tile in row]
+    blank = flat_goal.index(0)
+    table = load_distance_table(blank)
+    # Relabel so the custom goal becomes the reference goal; moves are identical in both labellings.
+    relabel = [0] * 9
+    for cell, tile in enumerate(tile for row in _reference_goal(blank) for tile in row):
+        relabel[flat_goal[cell]] = tile
+
+    code = encode_state(initial_state)
+    blank = [tile for row in initial_state for tile in row].index(0)
+    relabelled = 0
+    for cell in range(9):
+        relabelled |= relabel[(code >> (cell * CELL_BITS)) & CELL_MASK] << (cell * CELL_BITS)
+
+    lookups = 1
+    distance = table[TABLE_HEADER.size + permutation_rank(relabelled)]
+    if distance == UNREACHABLE:
+        return None, 0  # unsolvable; like the searches, nothing counts as explored
+    path = [decode_state(code)]
+    while distance:
+        blank_shift = blank * CELL_BITS
+        for cell in NEIGHBORS[blank]:
+            shift = cell * CELL_BITS
+            moved = (relabelled >> shift) & CELL_MASK
+            candidate = relabelled - (moved << shift) + (moved << blank_shift)
+            lookups += 1
+            if table[TABLE_HEADER.size + permutation_rank(candidate)] == distance - 1:
+                tile = (code >> shift) & CELL_MASK
+                code = code - (tile << shift) + (tile << blank_shift)
+                relabelled, blank, distance = candidate, cell, distance - 1
+                path.append(decode_state(code))
+                break
+    if telemetry:
+        telemetry.publish(lookups, lookups, lookups - len(path), 0, len(path), len(path) - 1)
+    return path, lookups
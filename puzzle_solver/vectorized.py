@@ -0,0 +1,107 @@
+"""NumPy layer-at-a-time search; imported only when the 'vectorized' mode runs."""
+import numpy as np
+
+from .board import (get_goal_positions, calculate_manhattan_distance, board_geometry, encode_state, decode_state,
+                    is_solvable)
+
+
+# Breadth-first iterative-deepening A*: each pass grows the search one depth layer at a time, keeping only
+# children with moves + Manhattan <= bound. A whole layer is expanded with array operations. Every move changes the
+# blank's colour on a chessboard, so a child of layer g is in layer g - 1 or g + 1. Duplicate detection therefore
+# only checks the previous layer, and no visited set is kept.
+
+def _vector_tables(goal_state):
+    """Per-board-size NumPy tables: neighbour cells (-1 padded) and Manhattan distance of each tile in each cell."""
+    size = len(goal_state)
+    bits, mask, neighbors = board_geometry(size)
+    neighbor_table = np.full((size * size, 4), -1, dtype=np.int64)
+    for cell, cells in enumerate(neighbors):
+        neighbor_table[cell, :len(cells)] = cells
+    distance = np.zeros((size * size, size * size), dtype=np.int16)
+    for tile, (goal_r, goal_c) in get_goal_positions(goal_state).items():
+        if tile:
+            for cell in range(size * size):
+                distance[tile, cell] = abs(cell // size - goal_r) + abs(cell % size - goal_c)
+    return np.uint64(bits), np.uint64(mask), neighbor_table, distance
+
+
+def _expand_layer(codes, blanks, values, tables, moves, bound):
+    """All children of a layer as (codes, blanks, values) sorted by code, plus the smallest f pruned by bound."""
+    bits, mask, neighbor_table, distance = tables
+    children = ([], [], [])
+    pruned = np.iinfo(np.int64).max
+    for direction in range(4):
+        cells = neighbor_table[blanks, direction]
+        valid = cells >= 0
+        code, blank, cell = codes[valid], blanks[valid], cells[valid]
+        cell_shift, blank_shift = cell.astype(np.uint64) * bits, blank.astype(np.uint64) * bits
+        tile = (code >> cell_shift) & mask
+        child = code - (tile << cell_shift) + (tile << blank_shift)
+        tile = tile.astype(np.int64)
+        value = values[valid] + distance[tile, blank] - distance[tile, cell]
+        keep = moves + 1 + value <= bound
+        if not keep.all():
+            pruned = min(pruned, int(value[~keep].min()) + moves + 1)
+        for target, part in zip(children, (child[keep], cell[keep], value[keep])):
+            target.append(part)
+    codes, blanks, values = (np.concatenate(parts) for parts in children)
+    codes, first = np.unique(codes, return_index=True)
+    return codes, blanks[first], values[first], pruned
+
+
+def solve_vectorized(initial_state, goal_state, telemetry=None, heuristic=None, budget=None):
+    """Breadth-first iterative-deepening A* on NumPy arrays (3x3 and 4x4, always with Manhattan distance)."""
+    size = len(initial_state)
+    if size not in (3, 4):
+        raise ValueError("The 'vectorized' solver packs boards into 64 bits, so it handles 3x3 and 4x4 only")
+    if not is_solvable(initial_state, goal_state):
+        return None, 0
+    tables = _vector_tables(goal_state)
+    bits, mask, neighbors = board_geometry(size)
+    start, goal = encode_state(initial_state), encode_state(goal_state)
+    start_layer = (np.array([start], dtype=np.uint64),
+                   np.array([[t for row in initial_state for t in row].index(0)], dtype=np.int64),
+                   np.array([calculate_manhattan_distance(initial_state, get_goal_positions(goal_state))],
+                            dtype=np.int64))
+    bound, nodes_explored, generated, kept, stored = int(start_layer[2][0]), 0, 0, 0, 1
+    while True:
+        layers = [start_layer[0]]
+        codes, blanks, values = start_layer
+        previous = np.empty(0, dtype=np.uint64)
+        next_bound = np.iinfo(np.int64).max
+        moves = 0
+        while len(codes) and goal not in layers[-1]:
+            nodes_explored += len(codes)
+            if budget:
+                budget.check(nodes_explored)
+            children, child_blanks, child_values, pruned = _expand_layer(codes, blanks, values, tables, moves, bound)
+            generated += len(children)
+            next_bound = min(next_bound, pruned)
+            fresh = ~np.isin(children, previous, assume_unique=True)
+            previous, codes, blanks, values = codes, children[fresh], child_blanks[fresh], child_values[fresh]
+            layers.append(codes)
+            moves, kept = moves + 1, kept + len(codes)
+            stored = max(stored, len(previous) + len(codes))
+            if telemetry and telemetry.due():
+                telemetry.publish(nodes_explored, generated, generated - kept, len(codes), stored, moves, generated)
+        if len(codes):
+            break
+        if next_bound == np.iinfo(np.int64).max:
+            return None, nodes_explored
+        bound = next_bound
+
+    # Walk back from the goal, each time to a neighbour that sits in the layer before.
+    path_codes, code = [goal], goal
+    blank = [t for row in goal_state for t in row].index(0)
+    for layer in reversed(layers[:-1]):
+        for cell in neighbors[blank]:
+            tile = (code >> (cell * bits)) & mask
+            parent = code - (tile << (cell * bits)) + (tile << (blank * bits))
+            index = np.searchsorted(layer, np.uint64(parent))
+            if index < len(layer) and layer[index] == parent:
+                code, blank = parent, cell
+                path_codes.append(code)
+                break
+    if telemetry:
+        telemetry.publish(nodes_explored, generated, generated - kept, len(codes), stored, moves, generated)
+    return [decode_state(code, size) for code in reversed(path_codes)], nodes_explored
@@ -0,0 +1,51 @@
+"""Headless batch solving on a process pool."""
+import json
+
+import pytest
+
+from puzzle_solver import default_goal, iter_puzzles
+from puzzle_solver.batch import solve_batch
+
+UNSOLVABLE = [[2, 1, 3], [4, 5, 6], [7, 8, 0]]
+
+
+@pytest.fixture(scope='module')
+def puzzles():
+    return list(iter_puzzles(30, 3, range(4, 22), None, seed=9))
+
+
+def _lines(puzzles):
+    return [json.dumps({'id': i, 'initial': board}) for i, (board, _) in enumerate(puzzles)]
+
+
+def test_ordered_results_follow_the_input(puzzles):
+    results = list(solve_batch(_lines(puzzles), workers=2, chunk_size=4, with_path=True))
+    assert [result['line'] for result in results] == list(range(1, len(puzzles) + 1))
+    for result, (board, depth) in zip(results, puzzles):
+        assert result['id'] == result['line'] - 1 and result['moves'] == depth
+        assert result['path'][0] == board and result['path'][-1] == default_goal(3)
+
+
+def test_unordered_results_are_complete(puzzles):
+    results = list(solve_batch(_lines(puzzles), workers=2, ordered=False, chunk_size=3))
+    assert sorted(result['id'] for result in results) == list(range(len(puzzles)))
+    assert all(result['moves'] == puzzles[result['id']][1] for result in results)
+
+
+def test_bad_lines_become_error_records(puzzles):
+    lines = ['{"initial": [[1, 2, 3], [4, 5, 6], [7, 8, 8]]}', 'not json', '',
+             json.dumps({'initial': UNSOLVABLE}), json.dumps({'initial': default_goal(3), 'goal': default_goal(4)}),
+             json.dumps({'initial': default_goal(4)}), json.dumps({'initial': puzzles[0][0]})]
+    results = list(solve_batch(lines, workers=2, chunk_size=2, algorithm='table'))
+    assert [result['line'] for result in results] == [1, 2, 4, 5, 6, 7]  # blank lines are skipped
+    errors = [result.get('error', '') for result in results]
+    assert errors[0].startswith('invalid board') and errors[1] == 'invalid JSON'
+    assert errors[2] == 'unsolvable for this goal state' and errors[3] == 'initial and goal boards differ in size'
+    assert '3x3' in errors[4]  # the table mode cannot take a 4x4 line, but the run carries on
+    assert 'error' not in results[5] and results[5]['moves'] == puzzles[0][1]
+
+
+def test_node_budget_is_per_line(puzzles):
+    deep = max(puzzles, key=lambda puzzle: puzzle[1])
+    results = list(solve_batch([json.dumps({'initial': deep[0]})], workers=1, max_nodes=10))
+    assert 'node budget' in results[0]['error'] and results[0]['nodes'] >= 10
@@ -0,0 +1,63 @@
+"""Pop order of the A* open lists."""
+import pytest
+
+from puzzle_solver.search import BucketQueue, _open_list
+
+
+def _drain(queue):
+    return [queue.pop() for _ in range(len(queue))]
+
+
+def test_lowest_f_first_then_deepest_g():
+    queue = BucketQueue()
+    for entry in [(5, 1, 10, 0), (3, 0, 11, 1), (5, 4, 12, 2), (3, 2, 13, 3), (4, 1, 14, 4), (5, 2, 15, 5)]:
+        queue.push(entry)
+    assert [(f, g) for f, g, _, _ in _drain(queue)] == [(3, 2), (3, 0), (4, 1), (5, 4), (5, 2), (5, 1)]
+    assert not queue
+
+
+def test_deep_ties_on_g_pop_newest_first():
+    queue = BucketQueue()
+    for code in range(3):
+        queue.push((7, 2, code, 0))
+    assert [code for _, _, code, _ in _drain(queue)] == [2, 1, 0]
+
+
+def test_lifo_pops_newest_entry_within_f():
+    queue = BucketQueue('lifo')
+    for entry in [(4, 3, 1, 0), (4, 1, 2, 0), (2, 0, 3, 0), (4, 2, 4, 0)]:
+        queue.push(entry)
+    assert [code for _, _, code, _ in _drain(queue)] == [3, 4, 2, 1]
+
+
+def test_push_below_current_minimum():
+    # An inconsistent heuristic can push an f below the one just popped; it must still come out next.
+    queue = BucketQueue()
+    queue.push((6, 1, 1, 0))
+    queue.push((8, 2, 2, 0))
+    assert queue.pop()[2] == 1
+    queue.push((4, 3, 3, 0))
+    assert [code for _, _, code, _ in _drain(queue)] == [3, 2]
+
+
+def test_pop_from_empty_queue():
+    queue = BucketQueue()
+    with pytest.raises(IndexError):
+        queue.pop()
+    queue.push((1, 0, 5, 0))
+    queue.pop()
+    with pytest.raises(IndexError):
+        queue.pop()
+
+
+@pytest.mark.parametrize('kind', ['bucket', 'lifo', 'heap'])
+def test_open_lists_pop_in_f_order(kind):
+    push, pop, container = _open_list(kind)
+    for f, g in [(9, 3), (2, 0), (7, 5), (2, 1), (5, 2)]:
+        push((f, g, f * 10 + g, 0))
+    assert [pop()[0] for _ in range(len(container))] == [2, 2, 5, 7, 9]
+
+
+def test_unknown_open_list():
+    with pytest.raises(ValueError):
+        _open_list('fifo')
@@ -0,0 +1,60 @@
+"""The two-tier solution cache: LRU counters, persistence and the disk budget."""
+from puzzle_solver import SolutionCache, default_goal, iter_puzzles, moves_to_path, path_to_moves, solve_puzzle
+
+
+def _boards(count, seed=1):
+    return [board for board, _ in iter_puzzles(count, 3, range(6, 20), default_goal(3), seed)]
+
+
+def test_memory_lru_counts(tmp_path):
+    goal_state = default_goal(3)
+    cache = SolutionCache(str(tmp_path / 'cache.sqlite3'), memory_entries=2)
+    first, second, third = _boards(3)
+    path, nodes = cache.solve(first, goal_state)
+    assert nodes > 0 and cache.get(first, goal_state) == path_to_moves(path)
+    cache.solve(second, goal_state)
+    cache.solve(third, goal_state)  # pushes `first` out of memory, but not off disk
+    assert cache.stats()['memory_entries'] == 2 and cache.evictions == 1
+    assert cache.solve(first, goal_state) == (path, 0)
+    assert (cache.hits, cache.misses) == (2, 3)
+
+
+def test_solutions_survive_reopening(tmp_path):
+    goal_state = default_goal(3)
+    filename = str(tmp_path / 'cache.sqlite3')
+    boards = _boards(4)
+    cache = SolutionCache(filename)
+    paths = [cache.solve(board, goal_state)[0] for board in boards]
+    used = cache.stats()['disk_bytes']
+    cache.db.close()
+    reopened = SolutionCache(filename)
+    assert reopened.stats()['disk_bytes'] == used
+    for board, path in zip(boards, paths):
+        assert reopened.solve(board, goal_state) == (path, 0)
+        assert moves_to_path(board, reopened.get(board, goal_state)) == path
+    assert reopened.misses == 0
+
+
+def test_disk_trim_and_byte_count(tmp_path):
+    goal_state = default_goal(3)
+    filename = str(tmp_path / 'cache.sqlite3')
+    writer, other = SolutionCache(filename, disk_bytes=600), SolutionCache(filename, disk_bytes=600)
+    boards = _boards(40, seed=2)
+    for board in boards:
+        moves = path_to_moves(solve_puzzle(board, goal_state)[0])
+        writer.put(board, goal_state, moves)
+        other.put(board, goal_state, moves)  # the same rows again, as a second batch worker would
+    rows, size = writer.db.execute('SELECT COUNT(*), SUM(LENGTH(key) + LENGTH(moves)) FROM solutions').fetchone()
+    assert 0 < rows < len(boards) and size <= 600
+    assert writer.stats()['disk_bytes'] == size
+    assert writer.evictions > 0
+    newest = writer.key(boards[-1], goal_state)  # the newest solution is never the one trimmed
+    assert writer.db.execute('SELECT 1 FROM solutions WHERE key = ?', (newest,)).fetchone()
+
+
+def test_suboptimal_solutions_are_not_cached(tmp_path):
+    goal_state = default_goal(3)
+    cache = SolutionCache(str(tmp_path / 'cache.sqlite3'))
+    board = _boards(1)[0]
+    cache.solve(board, goal_state, algorithm='anytime')
+    assert cache.get(board, goal_state) is None
@@ -0,0 +1,34 @@
+"""Disk-backed breadth-first search over the whole 3x3 state space."""
+import os
+
+import pytest
+
+from puzzle_solver import default_goal
+from puzzle_solver.external import external_bfs
+
+SPIRAL = [[1, 2, 3], [8, 0, 4], [7, 6, 5]]
+SOLVABLE_3X3 = 181440  # 9! / 2
+MEMORY_LIMIT = 1 << 20  # small enough that the wide layers are spilled as several runs
+
+
+def test_default_goal_histogram(tmp_path):
+    counts = external_bfs(default_goal(3), str(tmp_path), MEMORY_LIMIT)
+    assert sum(counts) == SOLVABLE_3X3
+    assert len(counts) == 32 and counts[:5] == [1, 2, 4, 8, 16] and counts[31] == 2
+    assert sorted(os.listdir(tmp_path)) == ['layer_030.states', 'layer_031.states', 'progress.json']
+
+
+def test_resume_after_max_depth(tmp_path):
+    partial = external_bfs(SPIRAL, str(tmp_path), MEMORY_LIMIT, max_depth=12)
+    assert len(partial) == 13
+    layers = []
+    counts = external_bfs(SPIRAL, str(tmp_path), MEMORY_LIMIT, on_layer=lambda depth, count: layers.append(depth))
+    assert counts[:13] == partial
+    assert sum(counts) == SOLVABLE_3X3 and len(counts) == 31
+    assert layers == list(range(31))  # the resumed layers are reported again, each once
+
+
+def test_other_goal_in_directory(tmp_path):
+    external_bfs(default_goal(3), str(tmp_path), max_depth=2)
+    with pytest.raises(ValueError):
+        external_bfs(SPIRAL, str(tmp_path))
@@ -0,0 +1,48 @@
+"""The exact-depth and uniform puzzle generator."""
+import itertools
+
+import pytest
+
+from puzzle_solver import default_goal, is_solvable, is_valid_board, iter_puzzles, solve_puzzle
+
+SPIRAL = [[1, 2, 3], [8, 0, 4], [7, 6, 5]]
+
+
+@pytest.mark.parametrize('goal_state,deepest', [(default_goal(3), 31), (SPIRAL, 30)], ids=['default', 'spiral'])
+def test_depth_is_the_optimal_distance(goal_state, deepest):
+    depths = list(range(deepest + 1))
+    puzzles = list(iter_puzzles(2 * len(depths), 3, depths, goal_state, seed=21))
+    assert [depth for _, depth in puzzles] == depths * 2  # a sequence of depths is cycled through
+    for board, depth in puzzles:
+        path, _ = solve_puzzle(board, goal_state, algorithm='table')
+        assert len(path) - 1 == depth
+
+
+def test_seeds_are_reproducible():
+    for size, depth in [(3, range(5, 25)), (3, None), (4, None), (5, None)]:
+        first = list(iter_puzzles(20, size, depth, None, seed=3))
+        assert first == list(iter_puzzles(20, size, depth, None, seed=3))
+        assert first != list(iter_puzzles(20, size, depth, None, seed=4))
+
+
+@pytest.mark.parametrize('size', [3, 4, 5])
+def test_uniform_boards_are_valid_and_solvable(size):
+    goal_state = default_goal(size)
+    boards = [board for board, depth in iter_puzzles(200, size, None, None, seed=5) if depth is None]
+    assert len(boards) == 200
+    for board in boards:
+        assert is_valid_board(board) and len(board) == size  # every tile exactly once
+        assert is_solvable(board, goal_state)
+    # Boards are drawn independently, so repeats are possible but should be rare in a space this large.
+    assert len({str(board) for board in boards}) == len(boards)
+
+
+def test_endless_stream():
+    assert len(list(itertools.islice(iter_puzzles(None, 3, 12, None, seed=1), 500))) == 500
+
+
+def test_unsupported_depth_requests():
+    with pytest.raises(ValueError):
+        next(iter_puzzles(1, 3, 32))
+    with pytest.raises(ValueError):
+        next(iter_puzzles(1, 4, 10))
@@ -0,0 +1,47 @@
+"""Admissibility of every heuristic and agreement of its incremental update with a full evaluation."""
+import random
+
+import pytest
+
+from puzzle_solver import HEURISTICS, board_geometry, default_goal, encode_state, get_heuristic, iter_puzzles
+
+SPIRAL = [[1, 2, 3], [8, 0, 4], [7, 6, 5]]
+CASES = [(name, size) for name in HEURISTICS for size in (3, 4)
+         if (name, size) != ('pattern_database', 4)]  # the 4x4 databases take several seconds to build
+
+
+@pytest.mark.parametrize('name,size', CASES)
+def test_update_matches_evaluate_along_random_walk(name, size):
+    goal_state = default_goal(size)
+    scorer = get_heuristic(name, goal_state)
+    bits, mask, neighbors = board_geometry(size)
+    rng = random.Random(size)
+    code, blank = encode_state(goal_state), size * size - 1
+    value = scorer.evaluate(code)
+    assert value == 0
+    for _ in range(300):
+        cell = rng.choice(neighbors[blank])
+        tile = (code >> cell * bits) & mask
+        code = code - (tile << cell * bits) + (tile << blank * bits)
+        new_value = scorer.update(value, code, tile, cell, blank)
+        assert new_value == scorer.evaluate(code)
+        if name != 'pattern_database':  # taking the minimum over blank cells makes the PDBs inconsistent
+            assert abs(new_value - value) <= 1  # consistent: one move changes the estimate by at most one
+        value, blank = new_value, cell
+
+
+@pytest.mark.parametrize('goal_state', [default_goal(3), SPIRAL], ids=['default', 'spiral'])
+@pytest.mark.parametrize('name', list(HEURISTICS))
+def test_admissible_on_3x3(name, goal_state):
+    scorer = get_heuristic(name, goal_state)
+    for board, depth in iter_puzzles(62, 3, range(31), goal_state, seed=5):  # 30 is the spiral's deepest
+        assert scorer.evaluate(encode_state(board)) <= depth
+
+
+def test_heuristics_dominate_manhattan():
+    goal_state = default_goal(3)
+    manhattan = get_heuristic('manhattan', goal_state)
+    for board, _ in iter_puzzles(64, 3, None, goal_state, seed=6):
+        code = encode_state(board)
+        for name in ('linear_conflict', 'walking_distance'):
+            assert get_heuristic(name, goal_state).evaluate(code) >= manhattan.evaluate(code)
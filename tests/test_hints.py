@@ -0,0 +1,54 @@
+"""Hints from the warm goal search and from the forward-search fallback."""
+import time
+
+import pytest
+
+from puzzle_solver import default_goal, iter_puzzles
+from puzzle_solver.hints import HintEngine
+
+UNSOLVABLE = [[2, 1, 3], [4, 5, 6], [7, 8, 0]]
+
+
+def _warm_engine(goal_state, **options):
+    engine = HintEngine(**options)
+    engine.set_goal(goal_state)
+    deadline = time.monotonic() + 60
+    while not engine.progress()[2]:
+        assert time.monotonic() < deadline, "the goal search never finished"
+        time.sleep(0.01)
+    return engine
+
+
+@pytest.fixture(scope='module')
+def engine():
+    yield _warm_engine(default_goal(3))
+
+
+def test_every_hint_is_one_move_closer(engine):
+    goal_state = default_goal(3)
+    assert engine.progress()[0] == 181440  # every solvable 3x3 board
+    for board, depth in iter_puzzles(32, 3, range(32), goal_state, seed=4):
+        distance, next_state = engine.hint(board)
+        assert distance == depth
+        while next_state is not None:
+            closer, after = engine.hint(next_state)
+            assert closer == distance - 1
+            distance, next_state = closer, after
+        assert distance == 0
+
+
+def test_goal_unsolvable_and_other_sizes(engine):
+    assert engine.hint(default_goal(3)) == (0, None)
+    assert engine.hint(UNSOLVABLE) is None
+    assert engine.hint(default_goal(4)) is None
+
+
+def test_forward_search_beyond_the_labelled_radius():
+    goal_state = default_goal(3)
+    small = _warm_engine(goal_state, max_states=500)
+    radius = small.progress()[1]
+    for board, depth in iter_puzzles(8, 3, range(radius + 2, radius + 10), goal_state, seed=8):
+        assert small.hint(board, forward=False) is None
+        distance, next_state = small.hint(board)
+        assert distance == depth
+        assert small.hint(next_state)[0] == depth - 1
@@ -0,0 +1,68 @@
+"""The append-only solve log, its aggregate checkpoint and exports."""
+import csv
+import io
+import json
+
+from puzzle_solver import HistoryManager
+
+RECORDS = [{'date': f'2024-0{month}-15 12:00:00', 'moves': moves, 'time': time, 'nodes': nodes,
+            'difficulty': difficulty, 'heuristic': 'manhattan'}
+           for month, moves, time, nodes, difficulty in [(1, 10, 0.5, 100, 8), (2, 20, 1.5, 300, 14),
+                                                          (3, 30, 0.25, 800, 22)]]
+
+
+def _write(path, records, tail=''):
+    path.write_text(''.join(json.dumps(record) + '\n' for record in records) + tail, encoding='utf-8')
+
+
+def test_append_and_reload(tmp_path):
+    filename = str(tmp_path / 'history.jsonl')
+    history = HistoryManager(filename)
+    history.add_solve(12, 0.5, 200, 9, 'manhattan')
+    history.add_solve(18, 0.25, 400, 16, None)
+    stats = history.get_stats()
+    assert stats['total'] == 2 and stats['avg_moves'] == 15 and stats['best_time'] == 0.25
+    assert set(stats['by_difficulty']) == {5, 15}
+    reloaded = HistoryManager(filename)
+    assert reloaded.get_stats() == stats
+    assert [record['heuristic'] for record in reloaded.iter_records()] == ['manhattan', None]
+
+
+def test_torn_trailing_line_is_dropped(tmp_path):
+    log = tmp_path / 'history.jsonl'
+    _write(log, RECORDS, tail='{"date": "2024-04-01 00:00:00", "mov')
+    history = HistoryManager(str(log))
+    assert history.get_stats()['total'] == 3
+    assert log.read_text(encoding='utf-8').endswith('}\n')  # compacted
+    history.add_solve(5, 0.1, 10, 3)
+    assert [record['moves'] for record in HistoryManager(str(log)).iter_records()] == [10, 20, 30, 5]
+
+
+def test_checkpoint_covers_the_log_it_was_taken_at(tmp_path):
+    filename = str(tmp_path / 'history.jsonl')
+    history = HistoryManager(filename, checkpoint_every=2)
+    for moves in (10, 20, 30):
+        history.add_solve(moves, 1.0, 50, 10)
+    checkpoint = tmp_path / 'history.stats.json'
+    saved = json.loads(checkpoint.read_text())
+    assert saved['count'] == 2
+    # Start-up trusts the checkpoint and only reads the line after its offset, so a marker in it survives.
+    saved['sum_moves'] += 1000
+    checkpoint.write_text(json.dumps(saved))
+    resumed = HistoryManager(filename, checkpoint_every=2)
+    assert resumed.get_stats()['total'] == 3 and resumed.aggregates['sum_moves'] == 1060
+
+
+def test_export_with_date_filters(tmp_path):
+    log = tmp_path / 'history.jsonl'
+    _write(log, RECORDS)
+    history = HistoryManager(str(log))
+    out = io.StringIO()
+    assert history.export(out, 'csv', start='2024-02-01', end='2024-03-01') == 1
+    rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+    assert [row['moves'] for row in rows] == ['20'] and list(rows[0]) == list(RECORDS[0])
+    out = io.StringIO()
+    assert history.export(out, 'json', start='2024-02-01') == 2
+    assert [record['moves'] for record in json.loads(out.getvalue())] == [20, 30]
+    out = io.StringIO()
+    assert history.export(out, 'json', end='2024-01-01') == 0 and json.loads(out.getvalue()) == []
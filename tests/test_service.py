@@ -0,0 +1,71 @@
+"""The local solve service: coalescing, load shedding and error replies."""
+import asyncio
+import json
+
+from puzzle_solver import default_goal, iter_puzzles
+from puzzle_solver.service import SolveService
+
+
+def _boards(count, depth=20):
+    return [board for board, _ in iter_puzzles(count, 3, depth, None, seed=12)]
+
+
+def _run(service, coroutine):
+    try:
+        return asyncio.run(coroutine)
+    finally:
+        service.close()
+
+
+def test_identical_requests_share_one_solve():
+    service = SolveService(workers=1)
+    board = _boards(1)[0]
+
+    async def main():
+        return await asyncio.gather(*(service.solve({'id': i, 'initial': board}) for i in range(3)))
+    replies = _run(service, main())
+    assert [reply['id'] for reply in replies] == [0, 1, 2]
+    assert all(reply['moves'] == 20 for reply in replies)
+    assert service.counters['coalesced'] == 2 and service.counters['solved'] == 3
+
+
+def test_requests_past_max_pending_are_shed():
+    service = SolveService(workers=1, max_pending=2)
+
+    async def main():
+        return await asyncio.gather(*(service.solve({'initial': board}) for board in _boards(4)))
+    replies = _run(service, main())
+    assert [reply.get('shed', False) for reply in replies] == [False, False, True, True]
+    assert all(reply['moves'] == 20 for reply in replies[:2])
+    assert service.counters['shed'] == 2 and service.metrics()['pending'] == 0
+
+
+def test_bad_requests_get_error_replies(tmp_path):
+    service = SolveService(workers=1)
+    address = str(tmp_path / 'solve.sock')
+
+    async def main():
+        server = asyncio.ensure_future(service.serve(address))
+        while not (tmp_path / 'solve.sock').exists():
+            await asyncio.sleep(0.01)
+        reader, writer = await asyncio.open_unix_connection(address)
+        requests = [b'not json', b'[1, 2]', json.dumps({'id': 'bad', 'initial': [[1, 1]]}).encode(),
+                    json.dumps({'id': 'type', 'initial': default_goal(3), 'max_nodes': 'many'}).encode(),
+                    json.dumps({'id': 'ok', 'initial': _boards(1, depth=6)[0]}).encode()]
+        writer.write(b'\n'.join(requests) + b'\n')
+        await writer.drain()
+        replies = [json.loads(await reader.readline()) for _ in requests]
+        writer.write(b'{"id": "m", "op": "metrics"}\n')
+        await writer.drain()
+        metrics = json.loads(await reader.readline())
+        writer.close()
+        server.cancel()
+        return replies, metrics
+    replies, metrics = _run(service, main())
+    errors = [reply for reply in replies if 'id' not in reply]
+    assert [reply['error'] for reply in errors] == ['invalid JSON (expected one object per line)'] * 2
+    by_id = {reply['id']: reply for reply in replies if 'id' in reply}
+    assert by_id['bad']['error'].startswith('invalid board')
+    assert by_id['type']['error'] == "'max_nodes' has the wrong type"
+    assert by_id['ok']['moves'] == 6 and 'path' not in by_id['ok']
+    assert metrics['id'] == 'm' and metrics['requests'] == 3 and metrics['failed'] == 2
@@ -0,0 +1,135 @@
+"""Each solver mode against the exact distance table on seeded boards."""
+import importlib.util
+
+import pytest
+
+from puzzle_solver import (HEURISTICS, CancelToken, SearchAborted, board_geometry, default_goal, iter_puzzles,
+                           solve_puzzle)
+from puzzle_solver.search import OPEN_LISTS
+
+SPIRAL = [[1, 2, 3], [8, 0, 4], [7, 6, 5]]
+GOALS = pytest.mark.parametrize('goal_state', [default_goal(3), SPIRAL], ids=['default', 'spiral'])
+UNSOLVABLE = [[2, 1, 3], [4, 5, 6], [7, 8, 0]]  # two tiles swapped: the other half of the state space
+
+
+def _boards(goal_state, count=4, seed=7):
+    return [board for board, _ in iter_puzzles(count, 3, range(8, 24, 4), goal_state, seed)]
+
+
+def _assert_legal(path, initial_state, goal_state):
+    """Each step slides one tile next to the blank into it and leaves every other tile in place."""
+    assert path[0] == initial_state and path[-1] == goal_state
+    neighbors = board_geometry(3)[2]
+    for before, after in zip(path, path[1:]):
+        before, after = [t for row in before for t in row], [t for row in after for t in row]
+        blank, moved = before.index(0), after.index(0)
+        assert moved in neighbors[blank]
+        before[blank], before[moved] = before[moved], 0
+        assert before == after
+
+
+def _assert_optimal(goal_state, seed=7, **options):
+    """Legal paths as long as the distance table's, and (None, 0) for an unsolvable board."""
+    for board in _boards(goal_state, seed=seed):
+        expected, _ = solve_puzzle(board, goal_state, algorithm='table')
+        path, _ = solve_puzzle(board, goal_state, **options)
+        _assert_legal(path, board, goal_state)
+        assert len(path) == len(expected)
+    assert solve_puzzle(UNSOLVABLE, default_goal(3), **options) == (None, 0)
+
+
+@GOALS
+def test_astar_is_optimal(goal_state):
+    _assert_optimal(goal_state, algorithm='astar')
+
+
+def test_table_is_exact():
+    goal_state = default_goal(3)
+    for board, depth in iter_puzzles(8, 3, range(0, 32, 4), goal_state, seed=3):
+        path, lookups = solve_puzzle(board, goal_state, algorithm='table')
+        _assert_legal(path, board, goal_state)
+        assert len(path) - 1 == depth and lookups > depth
+    assert solve_puzzle(UNSOLVABLE, goal_state, algorithm='table') == (None, 0)
+
+
+def test_table_rejects_other_sizes():
+    with pytest.raises(ValueError):
+        solve_puzzle(default_goal(3), default_goal(4), algorithm='table')
+    with pytest.raises(ValueError):
+        solve_puzzle(default_goal(4), default_goal(4), algorithm='table')
+
+
+@GOALS
+@pytest.mark.parametrize('heuristic', list(HEURISTICS))
+def test_astar_is_optimal_with_each_heuristic(heuristic, goal_state):
+    _assert_optimal(goal_state, seed=13, algorithm='astar', heuristic=heuristic)
+
+
+@GOALS
+@pytest.mark.parametrize('heuristic', ['manhattan', 'linear_conflict'])
+def test_idastar_is_optimal(heuristic, goal_state):
+    _assert_optimal(goal_state, algorithm='idastar', heuristic=heuristic)
+
+
+@GOALS
+def test_bidirectional_is_optimal(goal_state):
+    _assert_optimal(goal_state, algorithm='bidirectional')
+
+
+@pytest.mark.parametrize('limit', [{'max_nodes': 0}, {'time_limit': 0}, {'max_nodes': 100}])
+def test_zero_and_small_budgets_stop_the_search(limit):
+    goal_state = default_goal(3)
+    board = next(iter_puzzles(1, 3, 24, goal_state, seed=1))[0]
+    with pytest.raises(SearchAborted) as aborted:
+        solve_puzzle(board, goal_state, **limit)
+    assert aborted.value.reason == ('time limit' if 'time_limit' in limit else 'node budget')
+
+
+def test_cancelled_search_stops():
+    token = CancelToken()
+    token.cancel()
+    goal_state = default_goal(3)
+    board = next(iter_puzzles(1, 3, 24, goal_state, seed=1))[0]
+    with pytest.raises(SearchAborted, match='cancelled'):
+        solve_puzzle(board, goal_state, algorithm='idastar', cancel=token)
+
+
+@GOALS
+def test_anytime_ends_on_a_proven_optimum(goal_state):
+    _assert_optimal(goal_state, algorithm='anytime')
+
+
+def test_anytime_improves_until_proven():
+    goal_state = default_goal(3)
+    board = next(iter_puzzles(1, 3, 26, goal_state, seed=2))[0]
+    found = []
+    path, _ = solve_puzzle(board, goal_state, algorithm='anytime',
+                           on_solution=lambda path, nodes, proven: found.append((len(path), proven)))
+    assert [length for length, _ in found] == sorted((length for length, _ in found), reverse=True)
+    assert found[-1] == (len(path), True) and len(path) == 27
+
+
+@GOALS
+def test_vectorized_is_optimal(goal_state):
+    if importlib.util.find_spec('numpy') is None:
+        pytest.skip("the vectorized mode needs NumPy")
+    _assert_optimal(goal_state, algorithm='vectorized')
+
+
+@GOALS
+def test_hda_is_optimal(goal_state):
+    _assert_optimal(goal_state, algorithm='hda', workers=2)
+
+
+@pytest.mark.parametrize('heuristic', ['walking_distance', 'no_such_heuristic'])
+def test_hda_rejects_bad_heuristic_before_spawning(heuristic):
+    goal_state = default_goal(5)
+    board = [row[:] for row in goal_state]
+    board[4][3], board[4][4] = 0, board[4][3]
+    with pytest.raises(ValueError):
+        solve_puzzle(board, goal_state, algorithm='hda', heuristic=heuristic, workers=2)
+
+
+@pytest.mark.parametrize('open_list', OPEN_LISTS)
+def test_astar_open_lists_are_optimal(open_list):
+    _assert_optimal(default_goal(3), seed=11, open_list=open_list)